@@ -343,6 +343,7 @@ class ReviewEngine:
                     if self.logger:
                         self.logger.info(f"Review cancelled: {request_id}")
                     
+                    self._finish_progress(review_result)
                     return True
             
             return False
@@ -502,6 +503,7 @@ class ReviewEngine:
                         self.review_history.append(review_result)
                         if request.id in self.active_reviews:
                             del self.active_reviews[request.id]
+                        self._finish_progress(review_result)
                 
                 # Cleanup old reviews
                 if self.config.get('auto_cleanup_completed', True):
@@ -567,14 +569,28 @@ class ReviewEngine:
         if request_id in self.active_reviews:
             self.active_reviews[request_id].metadata['last_progress'] = progress
         
-        # Notify callbacks
-        if request_id in self.progress_callbacks:
-            for callback in self.progress_callbacks[request_id]:
-                try:
-                    callback(request_id, progress)
-                except Exception as e:
-                    if self.logger:
-                        self.logger.warning(f"Progress callback failed: {e}")
+        # Notify callbacks; copy so callbacks may (un)register concurrently
+        for callback in list(self.progress_callbacks.get(request_id, ())):
+            try:
+                callback(request_id, progress)
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"Progress callback failed: {e}")
+    
+    def _finish_progress(self, review_result: ReviewResult):
+        """Notify callbacks that a review has finished, then drop them"""
+        callbacks = self.progress_callbacks.pop(review_result.request_id, [])
+        progress = ReviewProgress(
+            stage="finalization",
+            progress_percentage=100.0,
+            current_operation=f"Review {review_result.status.value}"
+        )
+        for callback in callbacks:
+            try:
+                callback(review_result.request_id, progress)
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"Progress callback failed: {e}")
     
     def _update_statistics(self, review_result: ReviewResult):
         """Update engine statistics"""
@@ -11,7 +11,10 @@ import streamlit as st
 import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
+import atexit
+import os
 import tempfile
+import shutil
 import hashlib
 from datetime import datetime
 import mimetypes
@@ -37,6 +40,25 @@ except ImportError:
     DOCUMENT_ANALYZER_AVAILABLE = False
 
 
+@st.cache_resource
+def _process_upload_dir() -> Path:
+    """Get the process-wide directory that owns upload files (removed at interpreter exit)"""
+    tmp_dir = Path(tempfile.mkdtemp(prefix="are_"))
+    atexit.register(shutil.rmtree, tmp_dir, ignore_errors=True)
+    return tmp_dir
+
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _cached_validate(content_hash: str, size: int, ext: str, config: Dict[str, Any], _validator, _file_path: Path):
+    """
+    Validate an upload once per content and upload configuration
+    
+    Cached on (content_hash, size, ext, config); the validator and the temp
+    file path are excluded from hashing.
+    """
+    return _validator.validate_file_upload(_file_path, config)
+
+
 class FileUploader:
     """Advanced file uploader component with validation"""
     
@@ -211,8 +233,10 @@ class FileUploader:
             'warnings': [],
             'metadata': {},
             'hash': None,
+            'path': None,
             'upload_time': datetime.now()
         }
+        tmp_path = None
         
         try:
             # Basic validation
@@ -221,14 +245,27 @@ class FileUploader:
                 file_info['errors'].extend(validation_errors)
                 return file_info
             
-            # Create temporary file for advanced validation
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-                tmp_file.write(uploaded_file.read())
+            # Write the upload to a temporary name under the owned directory
+            # (UploadedFile already holds the bytes in memory; copying in 64 KB
+            # chunks only avoids a second full-size bytes copy from read())
+            content_hash = hashlib.blake2b(uploaded_file.getbuffer(), digest_size=16).hexdigest()
+            upload_dir = _process_upload_dir()
+            suffix = Path(uploaded_file.name).suffix.lower()
+            uploaded_file.seek(0)
+            with tempfile.NamedTemporaryFile(dir=upload_dir, suffix=suffix, delete=False) as tmp_file:
+                shutil.copyfileobj(uploaded_file, tmp_file, length=65536)
                 tmp_path = Path(tmp_file.name)
             
-            # Advanced validation using Phase 2 validator
+            # Advanced validation using Phase 2 validator (cached per content + config)
             if self.validator:
-                validation_result = self.validator.validate_file_upload(tmp_path, self.config)
+                validation_result = _cached_validate(
+                    content_hash,
+                    uploaded_file.size,
+                    tmp_path.suffix.lower(),
+                    self.config,
+                    self.validator,
+                    tmp_path
+                )
                 
                 if not validation_result.is_valid:
                     file_info['errors'].extend(validation_result.errors)
@@ -264,8 +301,12 @@ class FileUploader:
                     file_info['errors'].append(f"Security scan failed: {scan_result['reason']}")
                     return file_info
             
-            # Clean up temp file
-            tmp_path.unlink(missing_ok=True)
+            # Keep the accepted file under its content name; session state only
+            # holds its metadata and path
+            stored_path = upload_dir / f"{content_hash}{suffix}"
+            os.replace(tmp_path, stored_path)
+            tmp_path = None
+            file_info['path'] = str(stored_path)
             
             file_info['success'] = True
             
@@ -276,6 +317,10 @@ class FileUploader:
             file_info['errors'].append(f"Processing error: {str(e)}")
             if self.logger:
                 self.logger.error(f"File processing error for {uploaded_file.name}: {e}")
+        finally:
+            # Rejected or failed uploads are removed right away
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
         
         return file_info
     
@@ -16,9 +16,12 @@ import streamlit as st
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import time
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+
+
+def _latest_component_metrics() -> Dict[str, float]:
+    """Get the most recent execution time per component from the metrics buffer"""
+    # Later (name, seconds) entries overwrite earlier ones
+    return dict(st.session_state.get('performance_metrics', ()))
 
 
 class PerformanceMonitor:
@@ -137,7 +140,7 @@ class PerformanceMonitor:
             )
         
         with col4:
-            component_count = len(st.session_state.get('performance_metrics', {}))
+            component_count = len(_latest_component_metrics())
             st.metric(
                 "🧩 Active Components",
                 f"{component_count}",
@@ -158,6 +161,8 @@ class PerformanceMonitor:
         timestamps = [entry['timestamp'] for entry in performance_data[-20:]]
         render_times = [entry['render_time'] for entry in performance_data[-20:]]
         
+        import plotly.graph_objects as go
+        
         # Create chart
         fig = go.Figure()
         
@@ -208,6 +213,8 @@ class PerformanceMonitor:
         timestamps = [entry['timestamp'] for entry in performance_data[-20:]]
         memory_usage = [entry.get('memory_usage', 0) for entry in performance_data[-20:]]
         
+        import plotly.graph_objects as go
+        
         # Create chart
         fig = go.Figure()
         
@@ -249,7 +256,7 @@ class PerformanceMonitor:
         """Render component-specific performance metrics"""
         st.markdown("### 🧩 Component Performance")
         
-        component_metrics = st.session_state.get('performance_metrics', {})
+        component_metrics = _latest_component_metrics()
         
         if not component_metrics:
             st.info("No component performance data available")
@@ -433,7 +440,7 @@ class PerformanceMonitor:
             })
         
         # Check component performance
-        component_metrics = st.session_state.get('performance_metrics', {})
+        component_metrics = _latest_component_metrics()
         slow_components = [name for name, time in component_metrics.items() if time > 2.0]
         
         if slow_components:
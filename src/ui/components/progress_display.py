@@ -7,24 +7,145 @@ Phase 4.1: UI Integration - Progress Display Component
 """
 
 import streamlit as st
-import sys
-from pathlib import Path
+import collections
+import functools
+import os
+import re
+import threading
 from typing import Any, Optional, Dict, List
 import time
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
-# Add project paths for imports
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "src"))
 
-# Review engine imports
-try:
-    from src.review import ReviewStatus, ReviewEngine
-    REVIEW_ENGINE_AVAILABLE = True
-except ImportError:
-    REVIEW_ENGINE_AVAILABLE = False
-    ReviewStatus = None
+@functools.lru_cache(maxsize=1)
+def _review_symbols():
+    """
+    Import review engine symbols on first use
+    
+    Keeps the review subsystem off the app's import path until progress
+    tracking is actually rendered.
+    
+    Returns:
+        Tuple of (ReviewStatus, ReviewEngine), or (None, None) if unavailable
+    """
+    try:
+        from src.review import ReviewStatus, ReviewEngine
+        return ReviewStatus, ReviewEngine
+    except ImportError:
+        return None, None
+
+
+# Processing stages in execution order
+_STAGE_ORDER = (
+    'initialization',
+    'document_analysis',
+    'template_validation',
+    'rule_execution',
+    'results_compilation',
+    'finalization'
+)
+
+# Read-only stage metadata shared by all ProgressDisplay instances
+_STAGE_META = MappingProxyType({
+    'initialization': {'progress': 0, 'message': 'Initializing review process...'},
+    'document_analysis': {'progress': 25, 'message': 'Analyzing document structure...'},
+    'template_validation': {'progress': 50, 'message': 'Validating against template...'},
+    'rule_execution': {'progress': 75, 'message': 'Executing validation rules...'},
+    'results_compilation': {'progress': 90, 'message': 'Compiling results...'},
+    'finalization': {'progress': 100, 'message': 'Review completed!'}
+})
+
+# Estimated share of total processing time spent in each stage
+_COMPLETION_BREAKDOWN = (
+    ('Initialization', 0.1),
+    ('Document Analysis', 0.3),
+    ('Template Validation', 0.4),
+    ('Rule Execution', 0.15),
+    ('Results Compilation', 0.05)
+)
+
+# Common error patterns, matched case-insensitively in one pass
+_ERR_PATTERN = re.compile(
+    r'(?P<notfound>not found)|(?P<timeout>timeout)|(?P<format>format|parse)',
+    re.IGNORECASE
+)
+
+# Error pattern group -> (possible cause, suggestion)
+_ERR_SUGGESTIONS = {
+    'notfound': (
+        "**Possible Cause:** File or resource not found",
+        "💡 **Suggestion:** Verify document path and ensure file exists"
+    ),
+    'timeout': (
+        "**Possible Cause:** Processing timeout",
+        "💡 **Suggestion:** Try with a smaller document or increase timeout setting"
+    ),
+    'format': (
+        "**Possible Cause:** Document format issue",
+        "💡 **Suggestion:** Ensure document is a valid PDF or Word file"
+    )
+}
+
+_UNKNOWN_ERR_SUGGESTION = (
+    "**Cause:** Unknown error",
+    "💡 **Suggestion:** Check system logs or contact support"
+)
+
+# Partial reruns (Streamlit >= 1.37); older versions fall back to full reruns
+_fragment = getattr(st, 'fragment', None)
+
+# Seconds between fragment runs; matches ProgressDisplay.min_refresh_interval
+_WATCH_TICK = 1.0
+
+# Review states that keep the progress page live
+_LIVE_STATES = ('pending', 'in_progress')
+
+# Destructive actions guarded against duplicate submission
+_DEBOUNCED_ACTIONS = ('cancel', 'retry', 'new_review')
+
+
+def _pending_key(action: str, review_id: str) -> str:
+    """Session state key of the debounce flag for an action on a review"""
+    return f'{action}_pending_{review_id}'
+
+
+def _flag(*names: str):
+    """Button callback: set the given session state flags before the rerun"""
+    for name in names:
+        st.session_state[name] = True
+
+
+def _basename(path: str, key: str) -> str:
+    """Return the document file name, memoized per review in session state"""
+    cache_key = f'_bn_{key}'
+    if cache_key not in st.session_state:
+        st.session_state[cache_key] = os.path.basename(path)
+    return st.session_state[cache_key]
+
+
+def _progress_wakeup(review_engine, review_id: str) -> threading.Event:
+    """
+    Return this session's wake-up event for a review
+    
+    On first use, registers an engine progress callback that sets the
+    event, so stage changes are picked up without waiting for the next
+    adaptive poll.
+    """
+    key = f'_progress_wakeup_{review_id}'
+    if key not in st.session_state:
+        event = threading.Event()
+        callback = lambda _request_id, _progress: event.set()
+        review_engine.register_progress_callback(review_id, callback)
+        st.session_state[key] = (event, callback)
+    return st.session_state[key][0]
+
+
+def _release_wakeup(review_engine, review_id: str):
+    """Unregister this session's progress callback for a review, if any"""
+    entry = st.session_state.pop(f'_progress_wakeup_{review_id}', None)
+    if entry is not None:
+        review_engine.unregister_progress_callback(review_id, entry[1])
 
 
 class ProgressDisplay:
@@ -33,14 +154,13 @@ class ProgressDisplay:
     def __init__(self):
         """Initialize progress display"""
         self.refresh_interval = 2.0  # seconds
-        self.progress_stages = {
-            'initialization': {'progress': 0, 'message': 'Initializing review process...'},
-            'document_analysis': {'progress': 25, 'message': 'Analyzing document structure...'},
-            'template_validation': {'progress': 50, 'message': 'Validating against template...'},
-            'rule_execution': {'progress': 75, 'message': 'Executing validation rules...'},
-            'results_compilation': {'progress': 90, 'message': 'Compiling results...'},
-            'finalization': {'progress': 100, 'message': 'Review completed!'}
-        }
+        self.min_refresh_interval = _WATCH_TICK  # seconds, right after a state change
+        self.max_refresh_interval = 10.0  # seconds, for long idle stages
+        self.idle_threshold = 30.0  # seconds without change before backing off
+        self.perf_history_size = 60  # samples kept for the metrics chart
+        
+        # Status -> renderer dispatch table, built on first render
+        self._dispatch = None
     
     def render_progress_interface(
         self, 
@@ -69,19 +189,34 @@ class ProgressDisplay:
             st.error(f"❌ Could not find review: {review_id}")
             return
         
-        # Render progress based on status
-        if review_status.status.value == 'pending':
-            self._render_pending_status(review_status)
-        elif review_status.status.value == 'in_progress':
-            self._render_in_progress_status(review_status)
-        elif review_status.status.value == 'completed':
-            self._render_completed_status(review_status)
-        elif review_status.status.value == 'failed':
-            self._render_failed_status(review_status)
-        elif review_status.status.value == 'cancelled':
-            self._render_cancelled_status(review_status)
+        # Release debounced actions once the status has moved on
+        self._reset_pending_actions(review_status)
+        
+        # Render progress based on status; one clock read per render
+        now = datetime.now()
+        handler = self._get_dispatch().get(review_status.status, self._render_unknown_status)
+        handler(review_status, now)
+        
+        # Keep pending and running reviews live
+        if review_status.status.value in _LIVE_STATES and st.session_state.get('auto_refresh_enabled', True):
+            self._auto_refresh(review_engine, review_status)
         else:
-            self._render_unknown_status(review_status)
+            _release_wakeup(review_engine, review_id)
+    
+    def _get_dispatch(self) -> Dict[Any, Any]:
+        """Build the status -> renderer dispatch table once"""
+        if self._dispatch is None:
+            ReviewStatus, _ = _review_symbols()
+            self._dispatch = {}
+            if ReviewStatus is not None:
+                self._dispatch = {
+                    ReviewStatus.PENDING: self._render_pending_status,
+                    ReviewStatus.IN_PROGRESS: self._render_in_progress_status,
+                    ReviewStatus.COMPLETED: self._render_completed_status,
+                    ReviewStatus.FAILED: self._render_failed_status,
+                    ReviewStatus.CANCELLED: self._render_cancelled_status
+                }
+        return self._dispatch
     
     def _render_no_active_review(self):
         """Render interface when no review is active"""
@@ -104,7 +239,7 @@ class ProgressDisplay:
         Please check the system status in the main review panel.
         """)
     
-    def _render_pending_status(self, review_status):
+    def _render_pending_status(self, review_status, now: datetime):
         """Render pending review status"""
         st.info("⏳ Review Pending")
         
@@ -118,7 +253,7 @@ class ProgressDisplay:
             st.markdown(f"""
             **Review Details:**
             - Review ID: `{review_status.request_id[:12]}...`
-            - Document: `{Path(review_status.document_path).name}`
+            - Document: `{_basename(review_status.document_path, review_status.request_id)}`
             - Template: `{review_status.template_name}`
             - Priority: `{review_status.metadata.get('priority', 'normal')}`
             """)
@@ -126,27 +261,20 @@ class ProgressDisplay:
         with col2:
             # Time since submission
             if review_status.started_at:
-                wait_time = (datetime.now() - review_status.started_at).total_seconds()
+                wait_time = (now - review_status.started_at).total_seconds()
                 st.metric("Wait Time", f"{wait_time:.1f}s")
             
             # Auto-refresh button
             if st.button("🔄 Refresh", key="pending_refresh"):
                 st.rerun()
-        
-        # Auto-refresh for pending reviews
-        if st.session_state.get('auto_refresh_enabled', True):
-            with st.empty():
-                st.caption("Auto-refreshing every 2 seconds...")
-                time.sleep(2)
-                st.rerun()
     
-    def _render_in_progress_status(self, review_status):
+    def _render_in_progress_status(self, review_status, now: datetime):
         """Render in-progress review status"""
         st.success("🔄 Review In Progress")
         
         # Get progress information from metadata
         current_stage = review_status.metadata.get('current_stage', 'document_analysis')
-        progress_data = self.progress_stages.get(current_stage, self.progress_stages['document_analysis'])
+        progress_data = _STAGE_META.get(current_stage, _STAGE_META['document_analysis'])
         
         # Simulate dynamic progress within stage
         base_progress = progress_data['progress']
@@ -162,7 +290,7 @@ class ProgressDisplay:
         with col1:
             # Elapsed time
             if review_status.started_at:
-                elapsed = (datetime.now() - review_status.started_at).total_seconds()
+                elapsed = (now - review_status.started_at).total_seconds()
                 st.metric("Elapsed Time", f"{elapsed:.1f}s")
             else:
                 st.metric("Elapsed Time", "Unknown")
@@ -178,52 +306,46 @@ class ProgressDisplay:
             st.metric("Est. Remaining", f"{estimated_remaining:.0f}s")
         
         # Stage breakdown
-        st.subheader("📋 Processing Stages")
-        
-        stages_list = [
-            'initialization',
-            'document_analysis', 
-            'template_validation',
-            'rule_execution',
-            'results_compilation',
-            'finalization'
-        ]
-        
-        for i, stage in enumerate(stages_list):
-            stage_data = self.progress_stages[stage]
+        with st.status(f"📋 Processing Stages - {progress_data['message']}", state="running", expanded=True) as status_ui:
+            for stage in _STAGE_ORDER:
+                stage_data = _STAGE_META[stage]
+                
+                if stage == current_stage:
+                    # Current stage - show as in progress
+                    st.markdown(f"🔄 **{stage.replace('_', ' ').title()}** - In Progress")
+                    st.progress(0.7, stage_data['message'])
+                elif stage_data['progress'] <= dynamic_progress:
+                    # Completed stages
+                    st.markdown(f"✅ **{stage.replace('_', ' ').title()}** - Completed")
+                else:
+                    # Future stages
+                    st.markdown(f"⏳ **{stage.replace('_', ' ').title()}** - Pending")
             
-            if stage == current_stage:
-                # Current stage - show as in progress
-                st.markdown(f"🔄 **{stage.replace('_', ' ').title()}** - In Progress")
-                st.progress(0.7, stage_data['message'])
-            elif stage_data['progress'] <= dynamic_progress:
-                # Completed stages
-                st.markdown(f"✅ **{stage.replace('_', ' ').title()}** - Completed")
-            else:
-                # Future stages
-                st.markdown(f"⏳ **{stage.replace('_', ' ').title()}** - Pending")
+            if current_stage == _STAGE_ORDER[-1]:
+                status_ui.update(label=f"📋 Processing Stages - {progress_data['message']}", state="complete")
         
         # Performance metrics
         with st.expander("📊 Performance Metrics", expanded=False):
-            col1, col2 = st.columns(2)
+            import pandas as pd
             
-            with col1:
-                # Memory usage (simulated)
-                memory_usage = 45 + (time_factor * 2)
-                st.metric("Memory Usage", f"{memory_usage}%")
-                
-                # CPU usage (simulated)
-                cpu_usage = 30 + (time_factor * 3)
-                st.metric("CPU Usage", f"{cpu_usage}%")
+            # Simulated samples, kept as a rolling history for one chart
+            perf_history = st.session_state.setdefault(
+                '_perf_hist', collections.deque(maxlen=self.perf_history_size)
+            )
+            perf_history.append((
+                now,
+                45 + (time_factor * 2),  # Memory usage (%)
+                30 + (time_factor * 3),  # CPU usage (%)
+                1.2 + (time_factor * 0.1),  # Processing speed (pages/sec)
+                min(100, base_progress + (time_factor * 2))  # Data processed (%)
+            ))
             
-            with col2:
-                # Processing speed (simulated)
-                speed = 1.2 + (time_factor * 0.1)
-                st.metric("Processing Speed", f"{speed:.1f} pages/sec")
-                
-                # Data processed (simulated)
-                data_processed = min(100, base_progress + (time_factor * 2))
-                st.metric("Data Processed", f"{data_processed}%")
+            perf_df = pd.DataFrame(
+                list(perf_history),
+                columns=['Time', 'Memory Usage (%)', 'CPU Usage (%)',
+                         'Processing Speed (pages/sec)', 'Data Processed (%)']
+            ).set_index('Time')
+            st.line_chart(perf_df)
         
         # Control buttons
         col1, col2, col3 = st.columns(3)
@@ -241,43 +363,142 @@ class ProgressDisplay:
             st.session_state['auto_refresh_enabled'] = auto_refresh
         
         with col3:
-            if st.button("⏹️ Cancel Review", key="progress_cancel", type="secondary"):
-                st.session_state['cancel_review_requested'] = True
+            if st.button(
+                "⏹️ Cancel Review",
+                key="progress_cancel",
+                type="secondary",
+                disabled=self._is_action_pending('cancel', review_status.request_id),
+                on_click=_flag,
+                args=('cancel_review_requested', _pending_key('cancel', review_status.request_id))
+            ):
                 st.warning("Cancel request submitted...")
+    
+    def _is_action_pending(self, action: str, review_id: str) -> bool:
+        """Check whether an action was already submitted for this review"""
+        return st.session_state.get(_pending_key(action, review_id), False)
+    
+    def _reset_pending_actions(self, review_status):
+        """Clear debounce flags when the review status or stage changes"""
+        review_id = review_status.request_id
+        status_key = (review_status.status.value, review_status.metadata.get('current_stage'))
+        hash_key = f'action_status_hash_{review_id}'
+        
+        if st.session_state.get(hash_key) != status_key:
+            st.session_state[hash_key] = status_key
+            for action in _DEBOUNCED_ACTIONS:
+                st.session_state.pop(_pending_key(action, review_id), None)
+    
+    def _get_refresh_interval(self, review_status) -> float:
+        """
+        Compute an adaptive polling interval for the given review
+        
+        Polls quickly right after a state change and backs off while the
+        review stays unchanged, up to ``max_refresh_interval`` once it has
+        been idle for longer than ``idle_threshold``.
+        
+        Args:
+            review_status: Current review result
+            
+        Returns:
+            Refresh interval in seconds
+        """
+        status_hash = hash((
+            review_status.status.value,
+            review_status.metadata.get('current_stage'),
+            review_status.processing_time
+        ))
+        now = time.time()
+        
+        if st.session_state.get('last_status_hash') != status_hash:
+            # State changed - poll fast again
+            st.session_state['last_status_hash'] = status_hash
+            st.session_state['last_change_ts'] = now
+            interval = self.min_refresh_interval
+        else:
+            idle_time = now - st.session_state.get('last_change_ts', now)
+            ceiling = self.max_refresh_interval if idle_time > self.idle_threshold else self.refresh_interval
+            previous = st.session_state.get('refresh_interval', self.min_refresh_interval)
+            interval = min(previous * 2, ceiling)
+        
+        st.session_state['refresh_interval'] = interval
+        return interval
+    
+    @staticmethod
+    def _status_key(review_status) -> tuple:
+        """Status and stage of a review; a change triggers a full page rerun"""
+        return (review_status.status.value, review_status.metadata.get('current_stage'))
+    
+    def _auto_refresh(self, review_engine, review_status):
+        """Keep the page live until the review status or stage changes"""
+        if _fragment:
+            # Poll in a fragment; only the caption reruns until something changes
+            self._watch_review(review_engine, review_status.request_id, self._status_key(review_status))
+            return
+        
+        # Without fragments, wait out the adaptive interval (or the next
+        # engine progress update) and rerun the page
+        wakeup = _progress_wakeup(review_engine, review_status.request_id)
+        interval = self._get_refresh_interval(review_status)
+        with st.empty():
+            st.caption(f"Auto-refreshing every {interval:.0f} seconds...")
+            wakeup.wait(interval)
+            wakeup.clear()
+            st.rerun()
+    
+    def _watch_review(self, review_engine, review_id: str, status_key: tuple):
+        """
+        Poll the engine on the adaptive interval and rerun the full page once
+        the review moves on
         
-        # Auto-refresh for in-progress reviews
-        if st.session_state.get('auto_refresh_enabled', True):
-            with st.empty():
-                st.caption("Auto-refreshing every 2 seconds...")
-                time.sleep(2)
+        The fragment ticks every ``_WATCH_TICK`` seconds, but the engine is
+        only queried once the interval from ``_get_refresh_interval`` has
+        elapsed, so long idle stages back off to ``max_refresh_interval``.
+        An engine progress update wakes the next tick up immediately.
+        """
+        now = time.time()
+        wakeup = _progress_wakeup(review_engine, review_id)
+        if wakeup.is_set() or now >= st.session_state.get('next_progress_poll', 0.0):
+            # Clear before polling so an update during the poll is not lost
+            wakeup.clear()
+            review_status = review_engine.get_review_status(review_id)
+            if review_status is None or self._status_key(review_status) != status_key:
                 st.rerun()
+            interval = self._get_refresh_interval(review_status)
+            st.session_state['next_progress_poll'] = now + interval
+        
+        interval = st.session_state.get('refresh_interval', self.min_refresh_interval)
+        st.caption(f"Live updates every {interval:.0f} seconds...")
+    
+    if _fragment:
+        _watch_review = _fragment(run_every=_WATCH_TICK)(_watch_review)
     
-    def _render_completed_status(self, review_status):
+    def _render_completed_status(self, review_status, now: datetime):
         """Render completed review status"""
         st.success("✅ Review Completed Successfully!")
         
-        # Summary metrics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Status", "✅ Completed")
-        
-        with col2:
-            st.metric("Processing Time", f"{review_status.processing_time:.2f}s")
+        import pandas as pd
         
-        with col3:
-            if hasattr(review_status, 'overall_score'):
-                score = review_status.overall_score
-                st.metric("Overall Score", f"{score:.1f}/100")
-            else:
-                st.metric("Overall Score", "N/A")
+        # Summary metrics (rendered as a single table)
+        if hasattr(review_status, 'overall_score'):
+            score_text = f"{review_status.overall_score:.1f}/100"
+        else:
+            score_text = "N/A"
         
-        with col4:
-            if hasattr(review_status, 'compliance_percentage'):
-                compliance = review_status.compliance_percentage
-                st.metric("Compliance", f"{compliance:.1f}%")
-            else:
-                st.metric("Compliance", "N/A")
+        if hasattr(review_status, 'compliance_percentage'):
+            compliance_text = f"{review_status.compliance_percentage:.1f}%"
+        else:
+            compliance_text = "N/A"
+        
+        summary_df = pd.DataFrame({
+            "Metric": ["Status", "Processing Time", "Overall Score", "Compliance"],
+            "Value": [
+                "✅ Completed",
+                f"{review_status.processing_time:.2f}s",
+                score_text,
+                compliance_text
+            ]
+        })
+        st.dataframe(summary_df, hide_index=True, use_container_width=True)
         
         # Completion timeline
         st.subheader("⏱️ Completion Timeline")
@@ -286,20 +507,11 @@ class ProgressDisplay:
             total_time = review_status.processing_time
             
             # Show stage completion times (estimated breakdown)
-            stages_with_times = [
-                ('Initialization', 0.1 * total_time),
-                ('Document Analysis', 0.3 * total_time),
-                ('Template Validation', 0.4 * total_time),
-                ('Rule Execution', 0.15 * total_time),
-                ('Results Compilation', 0.05 * total_time)
-            ]
-            
-            for stage_name, stage_time in stages_with_times:
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.markdown(f"✅ **{stage_name}**")
-                with col2:
-                    st.text(f"{stage_time:.2f}s")
+            timeline_df = pd.DataFrame({
+                "Stage": [f"✅ {stage_name}" for stage_name, _ in _COMPLETION_BREAKDOWN],
+                "Time (s)": [round(fraction * total_time, 2) for _, fraction in _COMPLETION_BREAKDOWN]
+            })
+            st.dataframe(timeline_df, hide_index=True, use_container_width=True)
         
         # Quick results preview
         if hasattr(review_status, 'critical_issues') and review_status.critical_issues:
@@ -322,21 +534,24 @@ class ProgressDisplay:
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            if st.button("📊 View Full Results", key="view_results"):
-                st.session_state['switch_to_execution_tab'] = True
+            if st.button("📊 View Full Results", key="view_results", on_click=_flag, args=('switch_to_execution_tab',)):
                 st.info("Switch to the Review Execution tab to see full results")
         
         with col2:
-            if st.button("📄 Export Report", key="export_report"):
-                st.session_state['show_export_options'] = True
+            if st.button("📄 Export Report", key="export_report", on_click=_flag, args=('show_export_options',)):
                 st.info("Export options available in the Review Execution tab")
         
         with col3:
-            if st.button("🔄 Start New Review", key="new_review"):
-                st.session_state['clear_current_review'] = True
+            if st.button(
+                "🔄 Start New Review",
+                key="new_review",
+                disabled=self._is_action_pending('new_review', review_status.request_id),
+                on_click=_flag,
+                args=('clear_current_review', _pending_key('new_review', review_status.request_id))
+            ):
                 st.info("Ready for new review!")
     
-    def _render_failed_status(self, review_status):
+    def _render_failed_status(self, review_status, now: datetime):
         """Render failed review status"""
         st.error("❌ Review Failed")
         
@@ -352,7 +567,7 @@ class ProgressDisplay:
             # Show what was attempted
             st.markdown(f"""
             **Review Details:**
-            - Document: `{Path(review_status.document_path).name}`
+            - Document: `{_basename(review_status.document_path, review_status.request_id)}`
             - Template: `{review_status.template_name}`
             - Review Type: `{review_status.review_type.value}`
             """)
@@ -372,18 +587,15 @@ class ProgressDisplay:
         # Common error patterns and suggestions
         error_msg = review_status.error_message or ""
         
-        if "not found" in error_msg.lower():
-            st.warning("**Possible Cause:** File or resource not found")
-            st.info("💡 **Suggestion:** Verify document path and ensure file exists")
-        elif "timeout" in error_msg.lower():
-            st.warning("**Possible Cause:** Processing timeout")
-            st.info("💡 **Suggestion:** Try with a smaller document or increase timeout setting")
-        elif "format" in error_msg.lower() or "parse" in error_msg.lower():
-            st.warning("**Possible Cause:** Document format issue")
-            st.info("💡 **Suggestion:** Ensure document is a valid PDF or Word file")
-        else:
-            st.warning("**Cause:** Unknown error")
-            st.info("💡 **Suggestion:** Check system logs or contact support")
+        # Single scan; the first pattern in table order wins, as before
+        matched = {match.lastgroup for match in _ERR_PATTERN.finditer(error_msg)}
+        cause, suggestion = next(
+            (advice for group, advice in _ERR_SUGGESTIONS.items() if group in matched),
+            _UNKNOWN_ERR_SUGGESTION
+        )
+        
+        st.warning(cause)
+        st.info(suggestion)
         
         # Recovery actions
         st.subheader("🔧 Recovery Actions")
@@ -391,60 +603,64 @@ class ProgressDisplay:
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            if st.button("🔄 Retry Review", key="retry_review"):
-                st.session_state['retry_review_requested'] = True
+            if st.button(
+                "🔄 Retry Review",
+                key="retry_review",
+                disabled=self._is_action_pending('retry', review_status.request_id),
+                on_click=_flag,
+                args=('retry_review_requested', _pending_key('retry', review_status.request_id))
+            ):
                 st.info("Retry requested - review will be resubmitted")
         
         with col2:
-            if st.button("📋 View Logs", key="view_logs"):
-                st.session_state['show_error_logs'] = True
+            if st.button("📋 View Logs", key="view_logs", on_click=_flag, args=('show_error_logs',)):
                 st.info("Error logs (coming in Phase 4.2)")
         
         with col3:
-            if st.button("🧹 Clear Failed Review", key="clear_failed"):
-                st.session_state['clear_current_review'] = True
+            if st.button("🧹 Clear Failed Review", key="clear_failed", on_click=_flag, args=('clear_current_review',)):
                 st.info("Failed review cleared")
     
-    def _render_cancelled_status(self, review_status):
+    def _render_cancelled_status(self, review_status, now: datetime):
         """Render cancelled review status"""
         st.warning("⏹️ Review Cancelled")
         
-        col1, col2 = st.columns([3, 1])
+        # Time before cancellation, shown inline with the details
+        ran_for = ""
+        if review_status.processing_time > 0:
+            ran_for = f"\n            - Ran for: `{review_status.processing_time:.2f}s`"
         
-        with col1:
-            st.markdown(f"""
+        st.markdown(f"""
             **Review was cancelled:**
-            - Document: `{Path(review_status.document_path).name}`
+            - Document: `{_basename(review_status.document_path, review_status.request_id)}`
             - Template: `{review_status.template_name}`
-            - Cancellation time: `{review_status.completed_at or 'Unknown'}`
+            - Cancellation time: `{review_status.completed_at or 'Unknown'}`{ran_for}
             """)
         
-        with col2:
-            # Time before cancellation
-            if review_status.processing_time > 0:
-                st.metric("Ran For", f"{review_status.processing_time:.2f}s")
-        
         # Restart option
         col1, col2 = st.columns(2)
         
         with col1:
-            if st.button("🔄 Start New Review", key="restart_after_cancel"):
-                st.session_state['clear_current_review'] = True
+            if st.button(
+                "🔄 Start New Review",
+                key="restart_after_cancel",
+                disabled=self._is_action_pending('new_review', review_status.request_id),
+                on_click=_flag,
+                args=('clear_current_review', _pending_key('new_review', review_status.request_id))
+            ):
                 st.info("Ready for new review")
         
         with col2:
-            if st.button("🧹 Clear Status", key="clear_cancelled"):
-                st.session_state['clear_current_review'] = True
+            if st.button("🧹 Clear Status", key="clear_cancelled", on_click=_flag, args=('clear_current_review',)):
                 st.info("Status cleared")
     
-    def _render_unknown_status(self, review_status):
+    def _render_unknown_status(self, review_status, now: datetime):
         """Render unknown status"""
         st.warning(f"❓ Unknown Status: {review_status.status.value}")
         
         st.markdown(f"""
         **Review Information:**
         - Status: `{review_status.status.value}`
-        - Document: `{Path(review_status.document_path).name}`
+        - Document: `{_basename(review_status.document_path, review_status.request_id)}`
         - Started: `{review_status.started_at or 'Unknown'}`
         """)
         
@@ -478,6 +694,38 @@ class ProgressDisplay:
             st.metric("Engine Status", status_text)
 
 
+# Engine configuration shared by every UI component that talks to the engine
+REVIEW_ENGINE_CONFIG = MappingProxyType({
+    'max_concurrent_reviews': 3,
+    'enable_background_processing': True,
+    'detailed_logging': True
+})
+
+
+@st.cache_resource(show_spinner=False)
+def get_shared_review_engine():
+    """
+    Get the process-wide ReviewEngine instance
+    
+    The engine is cached as a resource, so it is shared across reruns and
+    sessions, and the review panel submits to the same engine the progress
+    page polls. Callers must treat its configuration as read-only.
+    
+    Returns:
+        Shared ReviewEngine instance, or None if the review engine is unavailable
+    """
+    _, ReviewEngine = _review_symbols()
+    if ReviewEngine is None:
+        return None
+    return ReviewEngine(config=dict(REVIEW_ENGINE_CONFIG))
+
+
+@st.cache_resource
 def create_progress_display() -> ProgressDisplay:
-    """Create and return a ProgressDisplay instance"""
+    """
+    Create and return the shared ProgressDisplay instance
+    
+    The instance holds no per-session state (all of it lives in
+    st.session_state), so a single cached object serves every rerun and session.
+    """
     return ProgressDisplay()
@@ -7,18 +7,22 @@ Phase 4.1: UI Integration - Results Panel Component
 """
 
 import streamlit as st
+import dataclasses
+import functools
+import html
 import sys
 from pathlib import Path
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Final
 import json
+import re
+from collections import Counter, defaultdict
 from datetime import datetime
-import plotly.graph_objects as go
-import plotly.express as px
 
-# Add project paths for imports
+# Add project paths for imports (once; app.py normally has them in place already)
 project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "src"))
+for _p in (str(project_root), str(project_root / "src")):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
 
 # Review engine imports
 try:
@@ -29,9 +33,209 @@ except ImportError:
     ReviewStatus = None
     ValidationSeverity = None
 
+# Score color bands: index = number of thresholds the score meets or exceeds
+_SCORE_THRESHOLDS = (40, 60, 75, 90)
+_SCORE_COLORS = ('#ff4444', '#ff8800', '#ffbb00', '#88cc00', '#00cc44')
+
+
+@functools.lru_cache(maxsize=1)
+def _score_bands():
+    """Build the NumPy score band arrays on first use (keeps numpy off the import path)"""
+    import numpy as np
+    return np, np.array(_SCORE_THRESHOLDS), np.array(_SCORE_COLORS)
+
+
+# Requirement status colors for the compliance pie chart
+_STATUS_COLORS: Final[Dict[str, str]] = {
+    'satisfied': '#00cc44',
+    'partially_satisfied': '#ffaa00',
+    'not_satisfied': '#ff4444',
+    'not_applicable': '#cccccc'
+}
+
+
+# Review fields read by the export builders, with defaults for partial objects
+_SNAPSHOT_DEFAULTS: Final[Dict[str, Any]] = {
+    'request_id': None,
+    'document_path': '',
+    'template_name': '',
+    'completed_at': None,
+    'processing_time': 0.0,
+    'overall_score': 0,
+    'compliance_percentage': 0,
+    'critical_issues': (),
+    'recommendations': (),
+    'status': None,
+    'metadata': None
+}
+
+
+def _snapshot(review_status) -> Dict[str, Any]:
+    """
+    Read a review's fields into a plain dict in one pass
+    
+    Dataclass results are copied shallowly from their instance dict;
+    dataclasses.asdict is avoided because it deep-copies the nested
+    analysis and validation results.
+    """
+    if dataclasses.is_dataclass(review_status):
+        return {**_SNAPSHOT_DEFAULTS, **vars(review_status)}
+    return {name: getattr(review_status, name, default) for name, default in _SNAPSHOT_DEFAULTS.items()}
+
+
+def _flag(name: str):
+    """Button callback: set a session state flag before the rerun"""
+    st.session_state[name] = True
+
+
+@functools.lru_cache(maxsize=256)
+def _basename(path: str) -> str:
+    """Return the file name of a document path (memoized)"""
+    return Path(path).name
+
+
+@st.cache_data(show_spinner=False)
+def _summarize_review(request_id: str, payload: tuple) -> Dict[str, Any]:
+    """
+    Derive the summary figures shared by the results header and tabs
+    
+    Args:
+        request_id: Review request ID (cache key)
+        payload: Hashable tuple of (overall_score, compliance_percentage,
+            critical_issues, recommendations)
+        
+    Returns:
+        Dictionary of pre-computed summary values
+    """
+    score, compliance, critical_issues, recommendations = payload
+    critical_count = len(critical_issues)
+    
+    # Determine overall assessment
+    if score >= 90 and compliance >= 95 and critical_count == 0:
+        assessment = ('success', "🟢 **Excellent** - Document meets all requirements")
+    elif score >= 75 and compliance >= 80 and critical_count <= 1:
+        assessment = ('info', "🟡 **Good** - Document meets most requirements with minor issues")
+    elif score >= 60 and compliance >= 70:
+        assessment = ('warning', "🟠 **Acceptable** - Document has several issues requiring attention")
+    else:
+        assessment = ('error', "🔴 **Poor** - Document has significant compliance issues")
+    
+    return {
+        'score': score,
+        'compliance': compliance,
+        'critical_issues': critical_issues,
+        'critical_count': critical_count,
+        'recommendations': recommendations,
+        'rec_count': len(recommendations),
+        'assessment': assessment
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _build_export(request_id: str, completed_at: str, export_format: str, _panel, _review_status) -> str:
+    """
+    Build export content once per review and format
+    
+    Cached on (request_id, completed_at, export_format); the panel and
+    review object are excluded from hashing.
+    """
+    if export_format == 'json':
+        return json.dumps(_panel._generate_json_export(_review_status), indent=2)
+    return _panel._generate_text_report(_review_status)
+
+
+@functools.lru_cache(maxsize=128)
+def _text_report(document_name: str, template_name: str, review_date: str,
+                 processing_time: float, score: float, compliance: float,
+                 critical_issues: tuple, recommendations: tuple) -> str:
+    """Assemble the plain-text review report from primitive review fields"""
+    header = f"""AUTOMATED REVIEW ENGINE - REVIEW REPORT
+{'=' * 50}
+Document: {document_name}
+Template: {template_name}
+Review Date: {review_date}
+Processing Time: {processing_time:.2f} seconds
+
+SUMMARY RESULTS
+{'-' * 20}
+Overall Score: {score:.1f}/100
+Compliance Percentage: {compliance:.1f}%
+Critical Issues: {len(critical_issues)}
+"""
+    
+    # Critical issues section (trailing blank line separates it from recommendations)
+    crit_block = ""
+    if critical_issues:
+        crit_block = "\nCRITICAL ISSUES\n" + "-" * 15 + "\n" + "\n".join(
+            f"{i}. {issue}" for i, issue in enumerate(critical_issues, 1)
+        ) + "\n"
+    
+    # Recommendations section
+    rec_block = ""
+    if recommendations:
+        rec_block = "\nRECOMMENDATIONS\n" + "-" * 15 + "\n" + "\n".join(
+            f"{i}. {rec}" for i, rec in enumerate(recommendations, 1)
+        )
+    
+    return header + crit_block + rec_block
+
+
+@st.cache_data(show_spinner=False)
+def _build_status_pie(labels: tuple, values: tuple, colors: tuple):
+    """Build the requirements status pie chart for the given counts"""
+    import plotly.express as px
+    
+    names = [label.replace('_', ' ').title() for label in labels]
+    fig = px.pie(
+        values=values,
+        names=names,
+        title="Requirements Status",
+        color_discrete_map=dict(zip(names, colors))
+    )
+    fig.update_layout(height=300)
+    return fig
+
 
 class ResultsPanel:
-    """Comprehensive results display and analysis component"""
+    """
+    Comprehensive results display and analysis component
+    
+    The panel is stateless, so callers should obtain the shared instance
+    via get_results_panel() rather than constructing one per rerun.
+    """
+    
+    # Severity levels in display order
+    SEVERITY_ORDER = ('critical', 'high', 'medium', 'low', 'info')
+    
+    SEVERITY_ICONS = {
+        'critical': '🔴',
+        'high': '🟠',
+        'medium': '🟡',
+        'low': '🟢',
+        'info': '🔵'
+    }
+    
+    REQ_STATUS_ICONS = {
+        'satisfied': '✅',
+        'partially_satisfied': '🟡',
+        'not_satisfied': '❌',
+        'not_applicable': '⚪'
+    }
+    
+    # Document info banner shown above the results
+    HEADER_TMPL = (
+        '<div style="background-color: #f0f2f6; padding: 1rem; border-radius: 0.5rem; margin-bottom: 1rem;">'
+        '<h4 style="margin: 0;">📄 {name}</h4>'
+        '<p style="margin: 0.5rem 0 0 0; color: #666;">'
+        'Template: {tmpl} | Processed: {done} | Time: {t:.2f}s'
+        '</p>'
+        '</div>'
+    )
+    
+    # Recommendation priority keywords, tested in this order
+    IMMEDIATE_RE = re.compile(r'must|required|critical|immediate', re.IGNORECASE)
+    IMPORTANT_RE = re.compile(r'should|important|recommended', re.IGNORECASE)
+    SUGGESTED_RE = re.compile(r'could|consider|improve', re.IGNORECASE)
     
     def __init__(self):
         """Initialize results panel"""
@@ -49,6 +253,9 @@ class ResultsPanel:
             'acceptable': 60,
             'poor': 40
         }
+        
+        # Issue cards rendered per severity before "show all"
+        self.issue_display_limit = 25
     
     def render_results_interface(
         self, 
@@ -70,8 +277,12 @@ class ResultsPanel:
             self._render_incomplete_review(review_status)
             return
         
+        # Derived structures shared by header and tabs
+        derived = self._get_derived_results(review_status)
+        summary = derived['summary']
+        
         # Main results header
-        self._render_results_header(review_status)
+        self._render_results_header(review_status, summary)
         
         # Results tabs
         if show_detailed:
@@ -84,13 +295,13 @@ class ResultsPanel:
             ])
             
             with tab1:
-                self._render_overview_tab(review_status)
+                self._render_overview_tab(review_status, summary, derived)
             
             with tab2:
-                self._render_issues_tab(review_status)
+                self._render_issues_tab(review_status, derived)
             
             with tab3:
-                self._render_recommendations_tab(review_status)
+                self._render_recommendations_tab(review_status, derived)
             
             with tab4:
                 self._render_detailed_analysis_tab(review_status)
@@ -99,7 +310,90 @@ class ResultsPanel:
                 self._render_export_tab(review_status)
         else:
             # Compact view
-            self._render_compact_results(review_status)
+            self._render_compact_results(review_status, summary)
+    
+    def _get_derived_results(self, review_status) -> Dict[str, Any]:
+        """
+        Get the structures derived from a review, reusing them across reruns
+        
+        Results are kept in session state under a fingerprint of the review,
+        so UI-only interactions (tab switches, expanders, checklist edits)
+        skip issue grouping, status counting and recommendation categorization.
+        
+        Args:
+            review_status: Completed review status object
+            
+        Returns:
+            Dictionary with summary, issue grouping, status counts and
+            recommendation categories
+        """
+        score = getattr(review_status, 'overall_score', 0)
+        fingerprint = (review_status.request_id, review_status.status.value, score)
+        
+        if st.session_state.get('_rp_fp') == fingerprint and '_rp_cached' in st.session_state:
+            return st.session_state['_rp_cached']
+        
+        compliance = getattr(review_status, 'compliance_percentage', 0)
+        critical_issues = getattr(review_status, 'critical_issues', ()) or ()
+        recommendations = getattr(review_status, 'recommendations', ()) or ()
+        
+        summary = _summarize_review(review_status.request_id, (
+            score,
+            compliance,
+            tuple(critical_issues),
+            tuple(recommendations)
+        ))
+        
+        validation_result = getattr(review_status, 'validation_result', None)
+        validation_issues = getattr(validation_result, 'validation_issues', None) or []
+        requirements_status = getattr(validation_result, 'requirements_status', None) or {}
+        
+        issues_by_severity = self._group_issues_by_severity(validation_issues)
+        
+        derived = {
+            'summary': summary,
+            'issues_by_severity': issues_by_severity,
+            'severity_counts': Counter({severity: len(issues) for severity, issues in issues_by_severity.items()}),
+            'status_counts': Counter(
+                status.value if hasattr(status, 'value') else str(status)
+                for status in requirements_status.values()
+            ),
+            'recommendation_categories': self._categorize_recommendations(summary['recommendations'])
+        }
+        
+        st.session_state['_rp_fp'] = fingerprint
+        st.session_state['_rp_cached'] = derived
+        return derived
+    
+    def _group_issues_by_severity(self, validation_issues) -> Dict[str, List[Any]]:
+        """Group validation issues by severity value"""
+        issues_by_severity = defaultdict(list)
+        for issue in validation_issues:
+            severity = issue.severity.value if hasattr(issue.severity, 'value') else str(issue.severity)
+            issues_by_severity[severity].append(issue)
+        return issues_by_severity
+    
+    def _categorize_recommendations(self, recommendations) -> Dict[str, List[str]]:
+        """Categorize recommendations by priority keywords"""
+        categories = {
+            'immediate': [],
+            'important': [],
+            'suggested': [],
+            'optional': []
+        }
+        
+        # Simple categorization based on keywords
+        for rec in recommendations:
+            if self.IMMEDIATE_RE.search(rec):
+                categories['immediate'].append(rec)
+            elif self.IMPORTANT_RE.search(rec):
+                categories['important'].append(rec)
+            elif self.SUGGESTED_RE.search(rec):
+                categories['suggested'].append(rec)
+            else:
+                categories['optional'].append(rec)
+        
+        return categories
     
     def _render_no_results(self):
         """Render interface when no results are available"""
@@ -142,65 +436,54 @@ class ResultsPanel:
             st.info("• Check document format and integrity")
             st.info("• Contact support if the problem persists")
     
-    def _render_results_header(self, review_status):
+    def _render_results_header(self, review_status, summary: Dict[str, Any]):
         """Render results header with key metrics"""
         st.header("📊 Review Results")
         
-        # Document info banner
-        document_name = Path(review_status.document_path).name
-        st.markdown(f"""
-        <div style="background-color: #f0f2f6; padding: 1rem; border-radius: 0.5rem; margin-bottom: 1rem;">
-            <h4 style="margin: 0;">📄 {document_name}</h4>
-            <p style="margin: 0.5rem 0 0 0; color: #666;">
-                Template: {review_status.template_name} | 
-                Processed: {review_status.completed_at or 'Unknown'} | 
-                Time: {review_status.processing_time:.2f}s
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        # Document info banner (user-provided fields are escaped)
+        st.markdown(self.HEADER_TMPL.format(
+            name=html.escape(_basename(review_status.document_path)),
+            tmpl=html.escape(str(review_status.template_name)),
+            done=html.escape(str(review_status.completed_at or 'Unknown')),
+            t=review_status.processing_time
+        ), unsafe_allow_html=True)
         
         # Key metrics row
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            score = getattr(review_status, 'overall_score', 0)
-            score_color = self._get_score_color(score)
             st.metric(
                 "Overall Score", 
-                f"{score:.1f}/100",
+                f"{summary['score']:.1f}/100",
                 delta=None,
                 help="Combined score based on compliance and validation results"
             )
         
         with col2:
-            compliance = getattr(review_status, 'compliance_percentage', 0)
             st.metric(
                 "Compliance", 
-                f"{compliance:.1f}%",
+                f"{summary['compliance']:.1f}%",
                 delta=None,
                 help="Percentage of template requirements satisfied"
             )
         
         with col3:
-            critical_count = len(getattr(review_status, 'critical_issues', []))
-            delta_color = "normal" if critical_count == 0 else "inverse"
             st.metric(
                 "Critical Issues", 
-                str(critical_count),
+                str(summary['critical_count']),
                 delta=None,
                 help="Number of critical compliance issues found"
             )
         
         with col4:
-            recommendations_count = len(getattr(review_status, 'recommendations', []))
             st.metric(
                 "Recommendations", 
-                str(recommendations_count),
+                str(summary['rec_count']),
                 delta=None,
                 help="Number of improvement recommendations generated"
             )
     
-    def _render_overview_tab(self, review_status):
+    def _render_overview_tab(self, review_status, summary: Dict[str, Any], derived: Dict[str, Any]):
         """Render overview tab with summary visualizations"""
         st.subheader("📈 Overview & Summary")
         
@@ -208,31 +491,19 @@ class ResultsPanel:
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            self._render_score_gauge(review_status)
+            self._render_score_gauge(review_status, summary['score'])
         
         with col2:
-            self._render_compliance_breakdown(review_status)
+            self._render_compliance_breakdown(review_status, derived['status_counts'])
         
         # Quick status summary
         st.subheader("🎯 Review Summary")
         
-        score = getattr(review_status, 'overall_score', 0)
-        compliance = getattr(review_status, 'compliance_percentage', 0)
-        critical_issues = len(getattr(review_status, 'critical_issues', []))
-        
-        # Determine overall assessment
-        if score >= 90 and compliance >= 95 and critical_issues == 0:
-            assessment = "🟢 **Excellent** - Document meets all requirements"
-            st.success(assessment)
-        elif score >= 75 and compliance >= 80 and critical_issues <= 1:
-            assessment = "🟡 **Good** - Document meets most requirements with minor issues"
-            st.info(assessment)
-        elif score >= 60 and compliance >= 70:
-            assessment = "🟠 **Acceptable** - Document has several issues requiring attention"
-            st.warning(assessment)
-        else:
-            assessment = "🔴 **Poor** - Document has significant compliance issues"
-            st.error(assessment)
+        compliance = summary['compliance']
+        
+        # Overall assessment
+        level, assessment = summary['assessment']
+        getattr(st, level)(assessment)
         
         # Key findings summary
         col1, col2 = st.columns(2)
@@ -241,13 +512,15 @@ class ResultsPanel:
             st.subheader("🔍 Key Findings")
             
             # Most critical issues (top 3)
-            critical_issues = getattr(review_status, 'critical_issues', [])
+            critical_issues = summary['critical_issues']
             if critical_issues:
-                for i, issue in enumerate(critical_issues[:3], 1):
+                n_crit = summary['critical_count']
+                top_crit = critical_issues[:3]
+                for i, issue in enumerate(top_crit, 1):
                     st.error(f"{i}. {issue}")
                 
-                if len(critical_issues) > 3:
-                    st.info(f"+ {len(critical_issues) - 3} more critical issues")
+                if n_crit > 3:
+                    st.info(f"+ {n_crit - 3} more critical issues")
             else:
                 st.success("✅ No critical issues found")
         
@@ -255,13 +528,15 @@ class ResultsPanel:
             st.subheader("💡 Priority Actions")
             
             # Top recommendations
-            recommendations = getattr(review_status, 'recommendations', [])
+            recommendations = summary['recommendations']
             if recommendations:
-                for i, rec in enumerate(recommendations[:3], 1):
+                n_rec = summary['rec_count']
+                top_rec = recommendations[:3]
+                for i, rec in enumerate(top_rec, 1):
                     st.info(f"{i}. {rec}")
                 
-                if len(recommendations) > 3:
-                    st.caption(f"+ {len(recommendations) - 3} more recommendations in the Recommendations tab")
+                if n_rec > 3:
+                    st.caption(f"+ {n_rec - 3} more recommendations in the Recommendations tab")
             else:
                 st.info("No specific recommendations at this time")
         
@@ -291,7 +566,7 @@ class ResultsPanel:
                 rules_applied = review_status.metadata.get('validation_rules_applied', 'Standard')
                 st.metric("Rules Applied", rules_applied)
     
-    def _render_issues_tab(self, review_status):
+    def _render_issues_tab(self, review_status, derived: Dict[str, Any]):
         """Render issues and findings tab"""
         st.subheader("⚠️ Issues & Findings Analysis")
         
@@ -302,7 +577,7 @@ class ResultsPanel:
             st.warning("Detailed validation results not available")
             
             # Show critical issues from summary
-            critical_issues = getattr(review_status, 'critical_issues', [])
+            critical_issues = derived['summary']['critical_issues']
             if critical_issues:
                 st.subheader("Critical Issues")
                 for issue in critical_issues:
@@ -310,60 +585,68 @@ class ResultsPanel:
             
             return
         
-        # Group issues by severity
-        validation_issues = getattr(validation_result, 'validation_issues', [])
+        # Issues grouped by severity
+        issues_by_severity = derived['issues_by_severity']
         
-        if not validation_issues:
+        if not issues_by_severity:
             st.success("🎉 No validation issues found!")
             st.balloons()
             return
         
-        # Group issues by severity
-        issues_by_severity = {}
-        for issue in validation_issues:
-            severity = issue.severity.value if hasattr(issue.severity, 'value') else str(issue.severity)
-            if severity not in issues_by_severity:
-                issues_by_severity[severity] = []
-            issues_by_severity[severity].append(issue)
-        
         # Issue severity summary
-        self._render_issues_summary_chart(issues_by_severity)
+        severity_counts = derived['severity_counts']
+        self._render_issues_summary_chart(severity_counts)
         
         # Detailed issues by severity
-        severity_order = ['critical', 'high', 'medium', 'low', 'info']
-        
-        for severity in severity_order:
-            if severity not in issues_by_severity:
+        for severity in self.SEVERITY_ORDER:
+            issues = issues_by_severity.get(severity)
+            if not issues:
                 continue
             
-            issues = issues_by_severity[severity]
-            severity_icon = {
-                'critical': '🔴',
-                'high': '🟠', 
-                'medium': '🟡',
-                'low': '🟢',
-                'info': '🔵'
-            }.get(severity, '⚪')
+            severity_icon = self.SEVERITY_ICONS.get(severity, '⚪')
             
             with st.expander(f"{severity_icon} {severity.title()} Issues ({len(issues)})", expanded=(severity in ['critical', 'high'])):
-                for i, issue in enumerate(issues, 1):
+                border_color = self.severity_colors.get(severity, '#ccc')
+                show_all_key = f"show_all_{severity}_{review_status.request_id}"
+                if st.session_state.get(show_all_key, False):
+                    display_limit = len(issues)
+                else:
+                    display_limit = min(len(issues), self.issue_display_limit)
+                
+                cards = []
+                for i, issue in enumerate(issues[:display_limit], 1):
+                    section = getattr(issue, 'section', None)
+                    suggestion = getattr(issue, 'suggestion', None)
+                    regulation = getattr(issue, 'regulation_reference', None)
+                    
                     # Issue card
-                    st.markdown(f"""
-                    <div style="border-left: 4px solid {self.severity_colors.get(severity, '#ccc')}; 
+                    cards.append(f"""
+                    <div style="border-left: 4px solid {border_color}; 
                                 padding: 1rem; margin: 0.5rem 0; background-color: #f8f9fa;">
                         <h5 style="margin-top: 0;">{i}. {getattr(issue, 'title', 'Unknown Issue')}</h5>
                         <p><strong>Description:</strong> {getattr(issue, 'description', 'No description available')}</p>
-                        {f'<p><strong>Section:</strong> {issue.section}</p>' if getattr(issue, 'section', None) else ''}
-                        {f'<p><strong>Suggestion:</strong> {issue.suggestion}</p>' if getattr(issue, 'suggestion', None) else ''}
-                        {f'<p><strong>Regulation:</strong> {issue.regulation_reference}</p>' if getattr(issue, 'regulation_reference', None) else ''}
+                        {f'<p><strong>Section:</strong> {section}</p>' if section else ''}
+                        {f'<p><strong>Suggestion:</strong> {suggestion}</p>' if suggestion else ''}
+                        {f'<p><strong>Regulation:</strong> {regulation}</p>' if regulation else ''}
                     </div>
-                    """, unsafe_allow_html=True)
+                    """)
+                
+                # One markdown element per severity bucket
+                st.markdown("\n".join(cards), unsafe_allow_html=True)
+                
+                if len(issues) > display_limit:
+                    st.button(
+                        f"Show all {len(issues)}",
+                        key=f"show_more_{severity}",
+                        on_click=_flag,
+                        args=(show_all_key,)
+                    )
         
         # Issue resolution tracking
         st.subheader("🔧 Issue Resolution Guide")
         
         # Prioritized action plan
-        critical_and_high = len(issues_by_severity.get('critical', [])) + len(issues_by_severity.get('high', []))
+        critical_and_high = severity_counts['critical'] + severity_counts['high']
         
         if critical_and_high > 0:
             st.error(f"🚨 **Immediate Action Required:** {critical_and_high} critical/high priority issues must be resolved")
@@ -378,35 +661,16 @@ class ResultsPanel:
         else:
             st.success("✅ No critical or high priority issues requiring immediate attention")
     
-    def _render_recommendations_tab(self, review_status):
+    def _render_recommendations_tab(self, review_status, derived: Dict[str, Any]):
         """Render recommendations tab"""
         st.subheader("💡 Recommendations & Improvement Suggestions")
         
-        recommendations = getattr(review_status, 'recommendations', [])
-        
-        if not recommendations:
+        if not derived['summary']['recommendations']:
             st.info("No specific recommendations generated for this review.")
             return
         
-        # Categorize recommendations
-        categories = {
-            'immediate': [],
-            'important': [],
-            'suggested': [],
-            'optional': []
-        }
-        
-        # Simple categorization based on keywords
-        for rec in recommendations:
-            rec_lower = rec.lower()
-            if any(word in rec_lower for word in ['must', 'required', 'critical', 'immediate']):
-                categories['immediate'].append(rec)
-            elif any(word in rec_lower for word in ['should', 'important', 'recommended']):
-                categories['important'].append(rec)
-            elif any(word in rec_lower for word in ['could', 'consider', 'improve']):
-                categories['suggested'].append(rec)
-            else:
-                categories['optional'].append(rec)
+        # Categorized recommendations
+        categories = derived['recommendation_categories']
         
         # Render categorized recommendations
         if categories['immediate']:
@@ -439,17 +703,28 @@ class ResultsPanel:
         all_recommendations = (categories['immediate'] + categories['important'] + 
                               categories['suggested'] + categories['optional'])
         
-        for i, rec in enumerate(all_recommendations, 1):
-            # Create checkbox for each recommendation
-            checked = st.checkbox(f"{rec}", key=f"rec_checkbox_{i}")
-            if checked:
-                st.success("✅ Marked as implemented")
+        import pandas as pd
+        
+        # Single editable table instead of one checkbox widget per recommendation
+        checklist_df = pd.DataFrame({
+            "Recommendation": all_recommendations,
+            "Done": [False] * len(all_recommendations)
+        })
+        edited_df = st.data_editor(
+            checklist_df,
+            column_config={
+                "Recommendation": st.column_config.TextColumn(disabled=True),
+                "Done": st.column_config.CheckboxColumn("Implemented")
+            },
+            hide_index=True,
+            use_container_width=True,
+            key=f"rec_editor_{review_status.request_id}"
+        )
         
         # Progress tracking
         total_recs = len(all_recommendations)
         if total_recs > 0:
-            # This would need session state tracking in a real implementation
-            implemented_count = 0  # Placeholder
+            implemented_count = int(edited_df["Done"].sum())
             progress = implemented_count / total_recs
             
             st.subheader("📊 Implementation Progress")
@@ -473,23 +748,15 @@ class ResultsPanel:
                 status_data = []
                 for req_id, status in requirements_status.items():
                     status_value = status.value if hasattr(status, 'value') else str(status)
-                    status_icon = {
-                        'satisfied': '✅',
-                        'partially_satisfied': '🟡',
-                        'not_satisfied': '❌',
-                        'not_applicable': '⚪'
-                    }.get(status_value, '❓')
+                    status_icon = self.REQ_STATUS_ICONS.get(status_value, '❓')
                     
                     status_data.append({
                         'Requirement': req_id.replace('_', ' ').title(),
-                        'Status': f"{status_icon} {status_value.replace('_', ' ').title()}",
-                        'ID': req_id
+                        'Status': f"{status_icon} {status_value.replace('_', ' ').title()}"
                     })
                 
-                # Display as table
-                import pandas as pd
-                df = pd.DataFrame(status_data)
-                st.dataframe(df[['Requirement', 'Status']], use_container_width=True)
+                # Display as table (list of dicts, no DataFrame needed)
+                st.table(status_data)
         
         # Document analysis details
         analysis_result = getattr(review_status, 'analysis_result', None)
@@ -506,7 +773,7 @@ class ResultsPanel:
                 # Text statistics
                 text_content = getattr(analysis_result, 'text_content', '')
                 if text_content:
-                    word_count = len(text_content.split())
+                    word_count = sum(1 for _ in re.finditer(r"\S+", text_content))
                     char_count = len(text_content)
                     st.markdown(f"**Word Count:** {word_count:,}")
                     st.markdown(f"**Character Count:** {char_count:,}")
@@ -544,23 +811,25 @@ class ResultsPanel:
         with col2:
             st.markdown(f"**Started:** {review_status.started_at or 'Unknown'}")
             st.markdown(f"**Completed:** {review_status.completed_at or 'Unknown'}")
-            st.markdown(f"**Document Path:** `{Path(review_status.document_path).name}`")
+            st.markdown(f"**Document Path:** `{_basename(review_status.document_path)}`")
         
         # Raw data export for technical users
         with st.expander("🔍 Raw Analysis Data (Technical)", expanded=False):
             st.warning("⚠️ This section contains technical data for debugging purposes")
             
-            # Show serializable parts of the results
-            raw_data = {
-                'request_id': review_status.request_id,
-                'status': review_status.status.value,
-                'overall_score': getattr(review_status, 'overall_score', None),
-                'compliance_percentage': getattr(review_status, 'compliance_percentage', None),
-                'processing_time': review_status.processing_time,
-                'metadata': review_status.metadata
-            }
-            
-            st.json(raw_data)
+            # Build and serialize only on request; collapsed expanders still execute
+            if st.checkbox("Load raw data", key="show_raw"):
+                # Show serializable parts of the results
+                raw_data = {
+                    'request_id': review_status.request_id,
+                    'status': review_status.status.value,
+                    'overall_score': getattr(review_status, 'overall_score', None),
+                    'compliance_percentage': getattr(review_status, 'compliance_percentage', None),
+                    'processing_time': review_status.processing_time,
+                    'metadata': review_status.metadata
+                }
+                
+                st.json(raw_data)
     
     def _render_export_tab(self, review_status):
         """Render export and actions tab"""
@@ -575,38 +844,31 @@ class ResultsPanel:
             st.markdown("**📄 Text Report**")
             st.markdown("Plain text summary report with findings and recommendations")
             
-            if st.button("📄 Generate Text Report", key="export_text"):
-                try:
-                    # This would use the review engine's export functionality
-                    report_content = self._generate_text_report(review_status)
-                    
-                    st.download_button(
-                        "⬇️ Download Text Report",
-                        report_content,
-                        f"review_report_{review_status.request_id[:8]}.txt",
-                        mime="text/plain",
-                        key="download_text"
-                    )
-                except Exception as e:
-                    st.error(f"Failed to generate text report: {e}")
+            try:
+                st.download_button(
+                    "⬇️ Download Text Report",
+                    self._get_export_content(review_status, 'text'),
+                    f"review_report_{review_status.request_id[:8]}.txt",
+                    mime="text/plain",
+                    key="download_text"
+                )
+            except Exception as e:
+                st.error(f"Failed to generate text report: {e}")
         
         with col2:
             st.markdown("**📊 JSON Data**")
             st.markdown("Structured data export for integration with other systems")
             
-            if st.button("📊 Generate JSON Export", key="export_json"):
-                try:
-                    json_data = self._generate_json_export(review_status)
-                    
-                    st.download_button(
-                        "⬇️ Download JSON Data",
-                        json.dumps(json_data, indent=2),
-                        f"review_data_{review_status.request_id[:8]}.json",
-                        mime="application/json",
-                        key="download_json"
-                    )
-                except Exception as e:
-                    st.error(f"Failed to generate JSON export: {e}")
+            try:
+                st.download_button(
+                    "⬇️ Download JSON Data",
+                    self._get_export_content(review_status, 'json'),
+                    f"review_data_{review_status.request_id[:8]}.json",
+                    mime="application/json",
+                    key="download_json"
+                )
+            except Exception as e:
+                st.error(f"Failed to generate JSON export: {e}")
         
         with col3:
             st.markdown("**📋 PDF Report**")
@@ -647,7 +909,7 @@ class ResultsPanel:
             - 📋 Integration with PLM systems (coming in Phase 6)
             """)
     
-    def _render_compact_results(self, review_status):
+    def _render_compact_results(self, review_status, summary: Dict[str, Any]):
         """Render compact results view"""
         st.subheader("📊 Results Summary")
         
@@ -655,41 +917,39 @@ class ResultsPanel:
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            score = getattr(review_status, 'overall_score', 0)
-            st.metric("Score", f"{score:.1f}/100")
+            st.metric("Score", f"{summary['score']:.1f}/100")
         
         with col2:
-            compliance = getattr(review_status, 'compliance_percentage', 0)
-            st.metric("Compliance", f"{compliance:.1f}%")
+            st.metric("Compliance", f"{summary['compliance']:.1f}%")
         
         with col3:
-            critical_count = len(getattr(review_status, 'critical_issues', []))
-            st.metric("Critical Issues", critical_count)
+            st.metric("Critical Issues", summary['critical_count'])
         
         # Quick summary
-        critical_issues = getattr(review_status, 'critical_issues', [])
+        critical_issues = summary['critical_issues']
         if critical_issues:
             st.subheader("⚠️ Critical Issues")
+            n_crit = summary['critical_count']
             for issue in critical_issues[:2]:  # Show top 2
                 st.error(f"• {issue}")
             
-            if len(critical_issues) > 2:
-                st.info(f"+ {len(critical_issues) - 2} more issues")
+            if n_crit > 2:
+                st.info(f"+ {n_crit - 2} more issues")
         else:
             st.success("✅ No critical issues found")
     
-    def _render_score_gauge(self, review_status):
+    def _render_score_gauge(self, review_status, score: float):
         """Render score gauge visualization"""
-        score = getattr(review_status, 'overall_score', 0)
+        import plotly.graph_objects as go
         
         # Create gauge chart
         fig = go.Figure(go.Indicator(
-            mode = "gauge+number+delta",
-            value = score,
-            domain = {'x': [0, 1], 'y': [0, 1]},
-            title = {'text': "Overall Score"},
-            delta = {'reference': 80},
-            gauge = {
+            mode="gauge+number+delta",
+            value=score,
+            domain={'x': [0, 1], 'y': [0, 1]},
+            title={'text': "Overall Score"},
+            delta={'reference': 80},
+            gauge={
                 'axis': {'range': [None, 100]},
                 'bar': {'color': self._get_score_color(score)},
                 'steps': [
@@ -707,10 +967,10 @@ class ResultsPanel:
         ))
         
         fig.update_layout(height=300)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key=f"score_gauge_{review_status.request_id}")
     
-    def _render_compliance_breakdown(self, review_status):
-        """Render compliance breakdown chart"""
+    def _render_compliance_breakdown(self, review_status, status_counts):
+        """Render compliance breakdown chart from requirement status counts"""
         # Get validation result
         validation_result = getattr(review_status, 'validation_result', None)
         
@@ -718,144 +978,95 @@ class ResultsPanel:
             st.info("Detailed compliance data not available")
             return
         
-        # Get requirements status
-        requirements_status = getattr(validation_result, 'requirements_status', {})
-        
-        if not requirements_status:
+        if not status_counts:
             st.info("Requirements status not available")
             return
         
-        # Count status types
-        status_counts = {}
-        for status in requirements_status.values():
-            status_value = status.value if hasattr(status, 'value') else str(status)
-            status_counts[status_value] = status_counts.get(status_value, 0) + 1
-        
-        # Create pie chart
-        labels = list(status_counts.keys())
-        values = list(status_counts.values())
-        
-        colors = {
-            'satisfied': '#00cc44',
-            'partially_satisfied': '#ffaa00', 
-            'not_satisfied': '#ff4444',
-            'not_applicable': '#cccccc'
-        }
-        
-        fig = px.pie(
-            values=values, 
-            names=[label.replace('_', ' ').title() for label in labels],
-            title="Requirements Status",
-            color_discrete_map={label.replace('_', ' ').title(): colors.get(label, '#666666') for label in labels}
-        )
+        # Create pie chart (figure cached on the counts)
+        labels, values = zip(*status_counts.items())
         
-        fig.update_layout(height=300)
-        st.plotly_chart(fig, use_container_width=True)
+        fig = _build_status_pie(labels, values, tuple(_STATUS_COLORS.get(label, '#666666') for label in labels))
+        st.plotly_chart(fig, use_container_width=True, key=f"compliance_pie_{review_status.request_id}")
     
-    def _render_issues_summary_chart(self, issues_by_severity):
-        """Render issues summary chart"""
-        if not issues_by_severity:
+    def _render_issues_summary_chart(self, severity_counts):
+        """Render issues summary chart from per-severity issue counts"""
+        if not severity_counts:
             return
         
-        # Create bar chart of issues by severity
-        severities = list(issues_by_severity.keys())
-        counts = [len(issues_by_severity[sev]) for sev in severities]
-        colors = [self.severity_colors.get(sev, '#666666') for sev in severities]
+        import altair as alt
+        import pandas as pd
         
-        fig = go.Figure(data=[
-            go.Bar(
-                x=severities,
-                y=counts,
-                marker_color=colors,
-                text=counts,
-                textposition='auto'
-            )
-        ])
+        # Known severities in SEVERITY_ORDER, then any others as they came
+        severities = [sev for sev in self.SEVERITY_ORDER if sev in severity_counts]
+        severities += [sev for sev in severity_counts if sev not in severities]
+        counts = [severity_counts[sev] for sev in severities]
+        colors = [self.severity_colors.get(sev, '#666666') for sev in severities]
         
-        fig.update_layout(
-            title="Issues by Severity",
-            xaxis_title="Severity Level",
-            yaxis_title="Number of Issues",
-            height=400
+        chart_data = pd.DataFrame({'Severity': severities, 'Issues': counts})
+        chart = alt.Chart(chart_data, title="Issues by Severity", height=400).mark_bar().encode(
+            x=alt.X('Severity:N', sort=severities, title="Severity Level"),
+            y=alt.Y('Issues:Q', title="Number of Issues"),
+            color=alt.Color('Severity:N', scale=alt.Scale(domain=severities, range=colors), legend=None),
+            tooltip=['Severity', 'Issues']
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.altair_chart(chart, use_container_width=True)
     
     def _get_score_color(self, score):
         """Get color based on score"""
-        if score >= 90:
-            return '#00cc44'  # Green
-        elif score >= 75:
-            return '#88cc00'  # Light green
-        elif score >= 60:
-            return '#ffbb00'  # Yellow
-        elif score >= 40:
-            return '#ff8800'  # Orange
-        else:
-            return '#ff4444'  # Red
+        np, thresholds, colors = _score_bands()
+        return str(colors[np.searchsorted(thresholds, score, side='right')])
+    
+    def _get_export_content(self, review_status, export_format: str) -> str:
+        """Get cached text or JSON export content for a review"""
+        return _build_export(
+            review_status.request_id,
+            str(review_status.completed_at),
+            export_format,
+            self,
+            review_status
+        )
     
     def _generate_text_report(self, review_status):
         """Generate text report content"""
-        document_name = Path(review_status.document_path).name
-        
-        report_lines = [
-            "AUTOMATED REVIEW ENGINE - REVIEW REPORT",
-            "=" * 50,
-            f"Document: {document_name}",
-            f"Template: {review_status.template_name}",
-            f"Review Date: {review_status.completed_at or 'Unknown'}",
-            f"Processing Time: {review_status.processing_time:.2f} seconds",
-            "",
-            "SUMMARY RESULTS",
-            "-" * 20,
-            f"Overall Score: {getattr(review_status, 'overall_score', 0):.1f}/100",
-            f"Compliance Percentage: {getattr(review_status, 'compliance_percentage', 0):.1f}%",
-            f"Critical Issues: {len(getattr(review_status, 'critical_issues', []))}",
-            ""
-        ]
-        
-        # Add critical issues
-        critical_issues = getattr(review_status, 'critical_issues', [])
-        if critical_issues:
-            report_lines.extend([
-                "CRITICAL ISSUES",
-                "-" * 15
-            ])
-            for i, issue in enumerate(critical_issues, 1):
-                report_lines.append(f"{i}. {issue}")
-            report_lines.append("")
-        
-        # Add recommendations
-        recommendations = getattr(review_status, 'recommendations', [])
-        if recommendations:
-            report_lines.extend([
-                "RECOMMENDATIONS",
-                "-" * 15
-            ])
-            for i, rec in enumerate(recommendations, 1):
-                report_lines.append(f"{i}. {rec}")
-        
-        return "\n".join(report_lines)
+        snap = _snapshot(review_status)
+        return _text_report(
+            _basename(snap['document_path']),
+            snap['template_name'],
+            str(snap['completed_at'] or 'Unknown'),
+            snap['processing_time'],
+            snap['overall_score'],
+            snap['compliance_percentage'],
+            tuple(snap['critical_issues'] or ()),
+            tuple(snap['recommendations'] or ())
+        )
     
     def _generate_json_export(self, review_status):
         """Generate JSON export data"""
+        snap = _snapshot(review_status)
         return {
-            'review_id': review_status.request_id,
-            'document_name': Path(review_status.document_path).name,
-            'template_name': review_status.template_name,
-            'review_date': str(review_status.completed_at or 'Unknown'),
-            'processing_time': review_status.processing_time,
+            'review_id': snap['request_id'],
+            'document_name': _basename(snap['document_path']),
+            'template_name': snap['template_name'],
+            'review_date': str(snap['completed_at'] or 'Unknown'),
+            'processing_time': snap['processing_time'],
             'results': {
-                'overall_score': getattr(review_status, 'overall_score', 0),
-                'compliance_percentage': getattr(review_status, 'compliance_percentage', 0),
-                'critical_issues': getattr(review_status, 'critical_issues', []),
-                'recommendations': getattr(review_status, 'recommendations', [])
+                'overall_score': snap['overall_score'],
+                'compliance_percentage': snap['compliance_percentage'],
+                'critical_issues': list(snap['critical_issues'] or ()),
+                'recommendations': list(snap['recommendations'] or ())
             },
-            'status': review_status.status.value,
-            'metadata': review_status.metadata
+            'status': snap['status'].value,
+            'metadata': snap['metadata']
         }
 
 
 def create_results_panel() -> ResultsPanel:
     """Create and return a ResultsPanel instance"""
     return ResultsPanel()
+
+
+@st.cache_resource
+def get_results_panel() -> ResultsPanel:
+    """Get the ResultsPanel instance shared across reruns and sessions"""
+    return ResultsPanel()
@@ -8,18 +8,14 @@ Phase 4.1: UI Integration - Enhanced Review Panel
 """
 
 import streamlit as st
-import sys
+import copy
+import dataclasses
 from pathlib import Path
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Final
 import time
 from datetime import datetime
 import uuid
 
-# Add project paths for imports
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "src"))
-
 # Review engine imports
 try:
     from src.review import (
@@ -39,6 +35,18 @@ except ImportError as e:
     create_review_engine = None
     create_review_request = None
 
+# Fast JSON serialization for exports (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Process-wide engine shared with the progress page
+try:
+    from src.ui.components.progress_display import get_shared_review_engine
+except ImportError:
+    get_shared_review_engine = None
+
 # Core infrastructure imports
 try:
     from src.core.logging_manager import LoggingManager
@@ -47,10 +55,91 @@ except ImportError:
     LoggingManager = None
     ErrorHandler = None
 
+# Partial reruns (Streamlit >= 1.37); older versions fall back to full reruns
+_fragment = getattr(st, 'fragment', None)
+
+# Status icons for the progress metrics
+_STATUS_ICONS: Final[Dict[str, str]] = {
+    'pending': '🟡',
+    'in_progress': '🔵',
+    'completed': '🟢',
+    'failed': '🔴',
+    'cancelled': '⚫'
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _get_logger():
+    """Get the review panel logger, initializing logging once per process"""
+    if not LoggingManager:
+        return None
+    logger_manager = LoggingManager({'level': 'INFO'})
+    logger_manager.initialize()
+    return logger_manager.get_logger('ui.review_panel')
+
+
+# Review configuration choices and their selectbox indices
+_TEMPLATE_OPTIONS = ('eu_doc', 'medical_device_declaration', 'custom_template')
+_REVIEW_TYPE_OPTIONS = ('eu_doc_validation', 'template_compliance', 'full_analysis', 'custom_script')
+_PRIORITY_OPTIONS = ('low', 'normal', 'high', 'urgent')
+
+_TEMPLATE_INDEX = {v: i for i, v in enumerate(_TEMPLATE_OPTIONS)}
+_REVIEW_TYPE_INDEX = {v: i for i, v in enumerate(_REVIEW_TYPE_OPTIONS)}
+_PRIORITY_INDEX = {v: i for i, v in enumerate(_PRIORITY_OPTIONS)}
+
+
+def _dump_json(data) -> Any:
+    """Serialize export data to indented JSON (bytes with orjson, str otherwise)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    
+    import json
+    return json.dumps(data, indent=2)
+
+
+@st.cache_data(show_spinner=False)
+def _export_content(request_id: str, completed_at: str, export_format: str, _engine) -> Any:
+    """
+    Export a finished review once per format
+    
+    Cached on (request_id, completed_at, export_format); the engine is
+    excluded from hashing.
+    """
+    result = _engine.export_review_results(request_id, format=export_format)
+    if export_format == 'json':
+        return _dump_json(result)
+    return result
+
 
 class ReviewPanel:
     """Enhanced review panel with full review engine integration"""
     
+    # Session state defaults, keyed by the values of state_keys
+    _DEFAULTS = {
+        'review_panel_current_review': None,
+        'review_panel_status': None,
+        'review_panel_results': None,
+        'review_panel_config': {
+            'template_name': 'eu_doc',
+            'review_type': 'eu_doc_validation',
+            'priority': 'normal',
+            'timeout_seconds': 300
+        },
+        'review_panel_history': []
+    }
+    
+    # Result fields read when rendering a non-dataclass review result
+    RESULT_FIELDS = (
+        'overall_score', 'compliance_percentage', 'processing_time',
+        'critical_issues', 'recommendations'
+    )
+    
+    # History table columns, in display order
+    HISTORY_COLUMNS = [
+        'document_name', 'template_name', 'status', 'started_at',
+        'overall_score', 'compliance_percentage', 'processing_time'
+    ]
+    
     def __init__(self):
         """Initialize review panel with review engine"""
         self.review_engine = None
@@ -76,19 +165,9 @@ class ReviewPanel:
     def _initialize_review_engine(self):
         """Initialize review engine and supporting components"""
         try:
-            # Create review engine
-            engine_config = {
-                'max_concurrent_reviews': 3,
-                'enable_background_processing': True,
-                'detailed_logging': True
-            }
-            self.review_engine = create_review_engine(engine_config)
-            
-            # Initialize logging if available
-            if LoggingManager:
-                logger_manager = LoggingManager({'level': 'INFO'})
-                logger_manager.initialize()
-                self.logger = logger_manager.get_logger('ui.review_panel')
+            # Shared engine and logger (cached across reruns)
+            self.review_engine = get_shared_review_engine() if get_shared_review_engine else None
+            self.logger = _get_logger()
             
             # Initialize error handler
             if ErrorHandler:
@@ -103,19 +182,9 @@ class ReviewPanel:
     
     def _initialize_session_state(self):
         """Initialize session state variables"""
-        for key in self.state_keys.values():
-            if key not in st.session_state:
-                if 'history' in key:
-                    st.session_state[key] = []
-                elif 'config' in key:
-                    st.session_state[key] = {
-                        'template_name': 'eu_doc',
-                        'review_type': 'eu_doc_validation',
-                        'priority': 'normal',
-                        'timeout_seconds': 300
-                    }
-                else:
-                    st.session_state[key] = None
+        # Copies keep sessions from sharing the mutable default list/dict
+        for key, default in self._DEFAULTS.items():
+            st.session_state.setdefault(key, copy.copy(default))
     
     def render_review_interface(self) -> None:
         """Render complete review interface with engine integration"""
@@ -264,42 +333,27 @@ class ReviewPanel:
         
         with col1:
             # Template selection
-            template_options = [
-                'eu_doc',
-                'medical_device_declaration',
-                'custom_template'
-            ]
-            
             new_template = st.selectbox(
                 "Template:",
-                options=template_options,
-                index=template_options.index(config['template_name']) if config['template_name'] in template_options else 0,
+                options=_TEMPLATE_OPTIONS,
+                index=_TEMPLATE_INDEX.get(config['template_name'], 0),
                 help="Select the validation template to use"
             )
             
             # Review type selection
-            review_type_options = [
-                'eu_doc_validation',
-                'template_compliance', 
-                'full_analysis',
-                'custom_script'
-            ]
-            
             new_review_type = st.selectbox(
                 "Review Type:",
-                options=review_type_options,
-                index=review_type_options.index(config['review_type']) if config['review_type'] in review_type_options else 0,
+                options=_REVIEW_TYPE_OPTIONS,
+                index=_REVIEW_TYPE_INDEX.get(config['review_type'], 0),
                 help="Select the type of review to perform"
             )
         
         with col2:
             # Priority selection
-            priority_options = ['low', 'normal', 'high', 'urgent']
-            
             new_priority = st.selectbox(
                 "Priority:",
-                options=priority_options,
-                index=priority_options.index(config['priority']) if config['priority'] in priority_options else 1,
+                options=_PRIORITY_OPTIONS,
+                index=_PRIORITY_INDEX.get(config['priority'], 1),
                 help="Set review priority level"
             )
             
@@ -348,21 +402,56 @@ class ReviewPanel:
             st.error("Could not retrieve review status")
             return
         
+        if review_status.status.value == 'in_progress':
+            if _fragment:
+                # Only the live block reruns while the review is processing
+                self._render_live_progress(current_review_id)
+            else:
+                self._render_status_metrics(review_status)
+                time.sleep(1)
+                st.rerun()
+        else:
+            self._render_status_metrics(review_status)
+        
+        # Results preview
+        if review_status.status.value == 'completed':
+            self._render_review_results(review_status)
+        
+        # Error display
+        if review_status.error_message:
+            st.error(f"❌ Error: {review_status.error_message}")
+        
+        # Control buttons
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            if st.button("🔄 Refresh Status"):
+                st.rerun()
+        
+        with col2:
+            if review_status.status.value in ['pending', 'in_progress']:
+                if st.button("⏹️ Cancel Review", type="secondary"):
+                    if self.review_engine.cancel_review(current_review_id):
+                        st.success("Review cancelled")
+                        st.session_state[self.state_keys['current_review_id']] = None
+                        st.rerun()
+        
+        with col3:
+            if review_status.status.value in ['completed', 'failed']:
+                if st.button("🧹 Clear Review"):
+                    st.session_state[self.state_keys['current_review_id']] = None
+                    st.session_state[self.state_keys['review_results']] = None
+                    st.rerun()
+    
+    def _render_status_metrics(self, review_status):
+        """Render status metrics and the progress bar for a review"""
         # Status overview
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            status_color = {
-                'pending': '🟡',
-                'in_progress': '🔵', 
-                'completed': '🟢',
-                'failed': '🔴',
-                'cancelled': '⚫'
-            }
-            
             st.metric(
                 "Status",
-                f"{status_color.get(review_status.status.value, '❓')} {review_status.status.value.title()}",
+                f"{_STATUS_ICONS.get(review_status.status.value, '❓')} {review_status.status.value.title()}",
                 delta=None
             )
         
@@ -386,38 +475,22 @@ class ReviewPanel:
             st.progress(progress_value / 100, f"Processing... {progress_value}%")
             
             st.info("🔄 Review in progress. This page will auto-update...")
-            time.sleep(1)
-            st.rerun()
-        
-        # Results preview
-        if review_status.status.value == 'completed':
-            self._render_review_results(review_status)
-        
-        # Error display
-        if review_status.error_message:
-            st.error(f"❌ Error: {review_status.error_message}")
-        
-        # Control buttons
-        col1, col2, col3 = st.columns(3)
+    
+    def _render_live_progress(self, review_id: str):
+        """Re-render progress every second; rerun the full page once the review settles"""
+        review_status = self.review_engine.get_review_status(review_id)
         
-        with col1:
-            if st.button("🔄 Refresh Status"):
-                st.rerun()
+        if not review_status:
+            return
         
-        with col2:
-            if review_status.status.value in ['pending', 'in_progress']:
-                if st.button("⏹️ Cancel Review", type="secondary"):
-                    if self.review_engine.cancel_review(current_review_id):
-                        st.success("Review cancelled")
-                        st.session_state[self.state_keys['current_review_id']] = None
-                        st.rerun()
+        self._render_status_metrics(review_status)
         
-        with col3:
-            if review_status.status.value in ['completed', 'failed']:
-                if st.button("🧹 Clear Review"):
-                    st.session_state[self.state_keys['current_review_id']] = None
-                    st.session_state[self.state_keys['review_results']] = None
-                    st.rerun()
+        if review_status.status.value != 'in_progress':
+            # Results and controls live outside the fragment
+            st.rerun()
+    
+    if _fragment:
+        _render_live_progress = _fragment(run_every="1s")(_render_live_progress)
     
     def _render_history_statistics(self):
         """Render review history and engine statistics"""
@@ -459,22 +532,19 @@ class ReviewPanel:
         if not history:
             st.info("No review history available yet.")
         else:
-            for i, review in enumerate(reversed(history[-10:])):  # Show last 10
-                with st.expander(f"Review {len(history) - i}: {review.get('document_name', 'Unknown')} - {review.get('status', 'Unknown')}"):
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.write(f"**Template:** {review.get('template_name', 'Unknown')}")
-                        st.write(f"**Status:** {review.get('status', 'Unknown')}")
-                        st.write(f"**Started:** {review.get('started_at', 'Unknown')}")
-                    
-                    with col2:
-                        if 'overall_score' in review:
-                            st.write(f"**Score:** {review['overall_score']:.1f}/100")
-                        if 'compliance_percentage' in review:
-                            st.write(f"**Compliance:** {review['compliance_percentage']:.1f}%")
-                        if 'processing_time' in review:
-                            st.write(f"**Time:** {review['processing_time']:.2f}s")
+            import pandas as pd
+            
+            # Last 10 reviews, newest first, as one table
+            recent = history[-10:][::-1]
+            df = pd.DataFrame(recent).reindex(columns=self.HISTORY_COLUMNS)
+            df.index = range(len(history), len(history) - len(recent), -1)
+            
+            styled = df.style.format({
+                'overall_score': '{:.1f}',
+                'compliance_percentage': '{:.1f}%',
+                'processing_time': '{:.2f}s'
+            }, na_rep='')
+            st.dataframe(styled, use_container_width=True)
     
     def _execute_review(self, selected_file: Dict, config: Dict):
         """Execute document review"""
@@ -507,7 +577,7 @@ class ReviewPanel:
                 'document_name': document_name,
                 'template_name': config['template_name'],
                 'status': 'submitted',
-                'started_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                'started_at': datetime.now().isoformat(sep=' ', timespec='seconds')
             }
             
             history = st.session_state[self.state_keys['review_history']]
@@ -557,68 +627,68 @@ class ReviewPanel:
         """Render comprehensive review results"""
         st.subheader("📊 Review Results")
         
+        # One shallow snapshot of the result fields (no deep copy as with dataclasses.asdict)
+        if dataclasses.is_dataclass(review_status):
+            snap = vars(review_status)
+        else:
+            snap = {name: getattr(review_status, name) for name in self.RESULT_FIELDS if hasattr(review_status, name)}
+        
         # Overall scores
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            if hasattr(review_status, 'overall_score'):
-                st.metric("Overall Score", f"{review_status.overall_score:.1f}/100")
+            if 'overall_score' in snap:
+                st.metric("Overall Score", f"{snap['overall_score']:.1f}/100")
         
         with col2:
-            if hasattr(review_status, 'compliance_percentage'):
-                st.metric("Compliance", f"{review_status.compliance_percentage:.1f}%")
+            if 'compliance_percentage' in snap:
+                st.metric("Compliance", f"{snap['compliance_percentage']:.1f}%")
         
         with col3:
-            st.metric("Processing Time", f"{review_status.processing_time:.2f}s")
+            st.metric("Processing Time", f"{snap['processing_time']:.2f}s")
         
         # Critical issues
-        if hasattr(review_status, 'critical_issues') and review_status.critical_issues:
+        critical_issues = snap.get('critical_issues')
+        if critical_issues:
             st.subheader("⚠️ Critical Issues")
-            for issue in review_status.critical_issues:
+            for issue in critical_issues:
                 st.error(f"• {issue}")
         
         # Recommendations
-        if hasattr(review_status, 'recommendations') and review_status.recommendations:
+        recommendations = snap.get('recommendations')
+        if recommendations:
             st.subheader("💡 Recommendations")
-            for rec in review_status.recommendations:
+            for rec in recommendations:
                 st.info(f"• {rec}")
         
         # Export options
         st.subheader("📤 Export Results")
         col1, col2, col3 = st.columns(3)
         
+        file_stem = f"review_report_{review_status.request_id[:8]}"
+        completed_at = str(review_status.completed_at)
+        
         with col1:
-            if st.button("📄 Export as Text"):
-                try:
-                    result_text = self.review_engine.export_review_results(
-                        review_status.request_id, 
-                        format='text'
-                    )
-                    st.download_button(
-                        "⬇️ Download Text Report",
-                        result_text,
-                        f"review_report_{review_status.request_id[:8]}.txt",
-                        mime="text/plain"
-                    )
-                except Exception as e:
-                    st.error(f"Export failed: {e}")
+            try:
+                st.download_button(
+                    "⬇️ Download Text Report",
+                    _export_content(review_status.request_id, completed_at, 'text', self.review_engine),
+                    f"{file_stem}.txt",
+                    mime="text/plain"
+                )
+            except Exception as e:
+                st.error(f"Export failed: {e}")
         
         with col2:
-            if st.button("📊 Export as JSON"):
-                try:
-                    result_json = self.review_engine.export_review_results(
-                        review_status.request_id, 
-                        format='json'
-                    )
-                    import json
-                    st.download_button(
-                        "⬇️ Download JSON Report",
-                        json.dumps(result_json, indent=2),
-                        f"review_report_{review_status.request_id[:8]}.json",
-                        mime="application/json"
-                    )
-                except Exception as e:
-                    st.error(f"Export failed: {e}")
+            try:
+                st.download_button(
+                    "⬇️ Download JSON Report",
+                    _export_content(review_status.request_id, completed_at, 'json', self.review_engine),
+                    f"{file_stem}.json",
+                    mime="application/json"
+                )
+            except Exception as e:
+                st.error(f"Export failed: {e}")
         
         with col3:
             st.info("PDF export coming in Phase 4.2")
@@ -18,7 +18,15 @@ class SettingsPanel:
         pass
     
     def render_settings_interface(self) -> Dict[str, Any]:
-        """Render settings interface"""
+        """
+        Render settings interface
+        
+        Returns:
+            Current widget values on every rerun. The last saved values are kept
+            in st.session_state['saved_settings'], and st.session_state['settings_saved']
+            tells whether the returned values match them, so downstream st.cache_data
+            consumers can key on a stable dict.
+        """
         st.markdown("### ⚙️ Application Settings")
         
         settings = {}
@@ -40,12 +48,15 @@ class SettingsPanel:
         
         # Save button
         if st.button("💾 Save Settings"):
+            st.session_state['saved_settings'] = dict(settings)
             st.success("✅ Settings saved successfully!")
-            return settings
         
-        return {}
+        st.session_state['settings_saved'] = settings == st.session_state.get('saved_settings')
+        
+        return settings
 
 
+@st.cache_resource
 def create_settings_panel() -> SettingsPanel:
-    """Create and return a SettingsPanel instance"""
+    """Create and return the shared SettingsPanel instance (cached across reruns)"""
     return SettingsPanel()
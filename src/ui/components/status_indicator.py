@@ -8,18 +8,42 @@ Phase 3.1: UI Foundation - Status Components
 """
 
 import streamlit as st
-from typing import Dict, Any, Optional, List
-from enum import Enum
+from typing import Dict, Any, Optional, List, Tuple, Callable
+from enum import IntEnum
 from datetime import datetime
+from collections import deque
 
 
-class StatusType(Enum):
-    """Status indicator types"""
-    SUCCESS = "success"
-    ERROR = "error"
-    WARNING = "warning"
-    INFO = "info"
-    PROCESSING = "processing"
+class StatusType(IntEnum):
+    """Status indicator types (values index _STATUS_TABLE)"""
+    SUCCESS = 0
+    ERROR = 1
+    WARNING = 2
+    INFO = 3
+    PROCESSING = 4
+
+
+# Status icons and display methods, in StatusType order
+_STATUS_TABLE: Tuple[Tuple[str, Callable], ...] = (
+    ("✅", st.success),
+    ("❌", st.error),
+    ("⚠️", st.warning),
+    ("ℹ️", st.info),
+    ("🔄", st.info)
+)
+
+
+def _status_entry(status: Any) -> Tuple[str, Callable]:
+    """Look up the icon and display method for a status, falling back to INFO"""
+    try:
+        return _STATUS_TABLE[StatusType(status)]
+    except (ValueError, TypeError):
+        return _STATUS_TABLE[StatusType.INFO]
+
+
+# Compact system status lines
+_SYSTEM_OK_MSG = "✅ **System Status**: All OK"
+_SYSTEM_BAD_MSG = "❌ **System Status**: Issues Detected"
 
 
 class StatusIndicator:
@@ -27,7 +51,15 @@ class StatusIndicator:
     
     def __init__(self):
         """Initialize status indicator"""
-        self.status_history = []
+        self.max_history = 200
+    
+    @property
+    def status_history(self) -> deque:
+        """This session's status events (the instance itself is shared across sessions)"""
+        history = st.session_state.get('status_indicator_history')
+        if history is None:
+            history = st.session_state['status_indicator_history'] = deque(maxlen=self.max_history)
+        return history
     
     def render_status(self, 
                      status: StatusType, 
@@ -43,38 +75,29 @@ class StatusIndicator:
             details: Optional detailed information
             show_timestamp: Whether to show timestamp
         """
-        # Status icons and colors
-        status_config = {
-            StatusType.SUCCESS: {"icon": "✅", "method": st.success},
-            StatusType.ERROR: {"icon": "❌", "method": st.error},
-            StatusType.WARNING: {"icon": "⚠️", "method": st.warning},
-            StatusType.INFO: {"icon": "ℹ️", "method": st.info},
-            StatusType.PROCESSING: {"icon": "🔄", "method": st.info}
-        }
-        
-        config = status_config.get(status, status_config[StatusType.INFO])
+        icon, method = _status_entry(status)
+        now = datetime.now()
         
         # Prepare message
-        display_message = f"{config['icon']} {message}"
+        display_message = f"{icon} {message}"
         
         if show_timestamp:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            display_message += f" ({timestamp})"
+            display_message += f" ({now:%H:%M:%S})"
         
         # Display status
-        config["method"](display_message)
+        method(display_message)
         
         # Display details if provided
         if details:
             with st.expander("Details", expanded=False):
                 st.text(details)
         
-        # Add to history
+        # Add to history (oldest entries drop off past max_history)
         self.status_history.append({
             'status': status,
             'message': message,
             'details': details,
-            'timestamp': datetime.now()
+            'timestamp': now
         })
     
     def render_system_status(self, 
@@ -94,13 +117,13 @@ class StatusIndicator:
                 icon = "✅" if status else "❌"
                 color = "green" if status else "red"
                 st.markdown(f":{color}[{icon} {component}]")
-        else:
-            # Compact view
-            all_ok = all(components.values())
-            overall_icon = "✅" if all_ok else "❌"
-            st.markdown(f"{overall_icon} **System Status**: {'All OK' if all_ok else 'Issues Detected'}")
+            return
+        
+        # Compact view (all() stops at the first failing component)
+        st.markdown(_SYSTEM_OK_MSG if all(components.values()) else _SYSTEM_BAD_MSG)
 
 
+@st.cache_resource
 def create_status_indicator() -> StatusIndicator:
-    """Create and return a StatusIndicator instance"""
+    """Create and return the shared StatusIndicator instance (history lives in session state)"""
     return StatusIndicator()
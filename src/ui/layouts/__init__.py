@@ -11,30 +11,11 @@ Layouts:
 - SidebarLayout: Sidebar navigation layout
 """
 
-# Import layouts with error handling
-try:
-    from .main_layout import MainLayout
-except ImportError:
-    MainLayout = None
+from .main_layout import MainLayout
+from .page_layout import PageLayout
+from .sidebar_layout import SidebarLayout
 
-try:
-    from .page_layout import PageLayout
-except ImportError:
-    PageLayout = None
-
-try:
-    from .sidebar_layout import SidebarLayout
-except ImportError:
-    SidebarLayout = None
-
-# Only export available layouts
-__all__ = []
-if MainLayout:
-    __all__.append('MainLayout')
-if PageLayout:
-    __all__.append('PageLayout')
-if SidebarLayout:
-    __all__.append('SidebarLayout')
+__all__ = ['MainLayout', 'PageLayout', 'SidebarLayout']
 
 # Layout version
 __version__ = "0.3.1"
@@ -15,9 +15,7 @@ class MainLayout:
     
     def __init__(self):
         """Initialize main layout"""
-        self.header_height = 100
-        self.footer_height = 50
-        self.sidebar_width = 300
+        pass
     
     def render_layout(self, 
                      header_component: Optional[Callable] = None,
@@ -37,22 +35,20 @@ class MainLayout:
         if header_component:
             header_component()
         
-        # Main content with sidebar
-        col1, col2 = st.columns([1, 4])  # Sidebar : Main content ratio
-        
-        with col1:
-            if sidebar_component:
+        # Sidebar in Streamlit's native sidebar, main content in the page body
+        if sidebar_component:
+            with st.sidebar:
                 sidebar_component()
         
-        with col2:
-            if main_component:
-                main_component()
+        if main_component:
+            main_component()
         
         # Footer
         if footer_component:
             footer_component()
 
 
+@st.cache_resource
 def create_main_layout() -> MainLayout:
-    """Create and return a MainLayout instance"""
+    """Create and return the shared MainLayout instance (cached across reruns)"""
     return MainLayout()
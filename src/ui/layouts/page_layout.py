@@ -7,7 +7,17 @@ Phase 3.1: UI Foundation - Page Layout
 """
 
 import streamlit as st
-from typing import Dict, Any, Optional
+import functools
+from typing import Dict, Any, Optional, Callable
+
+# Partial reruns (Streamlit >= 1.37); older versions render columns normally
+_fragment = getattr(st, 'fragment', None)
+
+
+@functools.lru_cache(maxsize=64)
+def _as_fragment(component: Callable) -> Callable:
+    """Wrap a column component in st.fragment once and reuse the wrapper"""
+    return _fragment(component)
 
 
 class PageLayout:
@@ -19,35 +29,43 @@ class PageLayout:
     
     def render_page_header(self, title: str, subtitle: Optional[str] = None) -> None:
         """Render page header with title and optional subtitle"""
-        st.markdown(f"## {title}")
         if subtitle:
-            st.markdown(f"*{subtitle}*")
-        st.markdown("---")
+            st.markdown(f"## {title}\n\n*{subtitle}*\n\n---")
+        else:
+            st.markdown(f"## {title}\n\n---")
     
-    def render_two_column_layout(self, left_component: callable, right_component: callable) -> None:
-        """Render two-column layout"""
+    def render_two_column_layout(self, left_component: callable, right_component: callable, fragment: bool = False) -> None:
+        """Render two-column layout (opt in to per-column reruns with fragment)"""
         col1, col2 = st.columns(2)
         
         with col1:
-            left_component()
+            self._render_column(left_component, fragment)
         
         with col2:
-            right_component()
+            self._render_column(right_component, fragment)
     
-    def render_three_column_layout(self, left_component: callable, center_component: callable, right_component: callable) -> None:
-        """Render three-column layout"""
+    def render_three_column_layout(self, left_component: callable, center_component: callable, right_component: callable, fragment: bool = False) -> None:
+        """Render three-column layout (opt in to per-column reruns with fragment)"""
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            left_component()
+            self._render_column(left_component, fragment)
         
         with col2:
-            center_component()
+            self._render_column(center_component, fragment)
         
         with col3:
-            right_component()
+            self._render_column(right_component, fragment)
+    
+    def _render_column(self, component: callable, fragment: bool) -> None:
+        """Render a column component, as an st.fragment when requested and supported"""
+        if fragment and _fragment:
+            _as_fragment(component)()
+        else:
+            component()
 
 
+@st.cache_resource
 def create_page_layout() -> PageLayout:
-    """Create and return a PageLayout instance"""
+    """Create and return the shared PageLayout instance (cached across reruns)"""
     return PageLayout()
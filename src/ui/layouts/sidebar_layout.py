@@ -26,26 +26,32 @@ class SidebarLayout:
             current_page: Current active page
             
         Returns:
-            Selected page key or None
+            Selected page key if it differs from the current page, else None
         """
-        selected_page = None
-        
         st.markdown("## 🎯 Navigation")
         
-        for display_name, page_key in menu_items.items():
-            if st.button(display_name, key=f"nav_{page_key}", use_container_width=True):
-                selected_page = page_key
+        # One radio widget instead of a button per menu item
+        labels = list(menu_items.keys())
+        default_idx = next((i for i, key in enumerate(menu_items.values()) if key == current_page), 0)
+        
+        choice = st.radio("Navigation", labels, index=default_idx, key="nav_menu", label_visibility="collapsed")
+        selected_page = menu_items.get(choice)
         
-        return selected_page
+        return selected_page if selected_page != current_page else None
     
     def render_quick_stats(self, stats: Dict[str, Any]) -> None:
         """Render quick statistics in sidebar"""
         st.markdown("### 📈 Quick Stats")
         
-        for label, value in stats.items():
-            st.metric(label, value)
+        if not stats:
+            return
+        
+        # Side by side in one row of columns
+        for col, (label, value) in zip(st.columns(len(stats)), stats.items()):
+            col.metric(label, value)
 
 
+@st.cache_resource
 def create_sidebar_layout() -> SidebarLayout:
-    """Create and return a SidebarLayout instance"""
+    """Create and return the shared SidebarLayout instance (cached across reruns)"""
     return SidebarLayout()
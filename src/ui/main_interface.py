@@ -15,11 +15,16 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 import time
 import functools
+import importlib
+import threading
+from collections import deque
 
-# Add project paths
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "src"))
+# Add project paths (once; Streamlit reloads re-import this module)
+_HERE = Path(__file__).resolve()
+project_root = _HERE.parents[2]
+for _p in (str(project_root), str(project_root / "src")):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
 
 # Import core components
 try:
@@ -28,14 +33,8 @@ try:
     from src.core.error_handler import ErrorHandler
     from src.core.validation_utils import DataValidator
     
-    # Phase 4.1: Import new integrated components
-    from src.ui.components.review_panel import create_review_panel
-    from src.ui.components.progress_display import create_progress_display
-    from src.ui.components.results_panel import create_results_panel
-    from src.ui.components.config_panel import create_config_panel
-    from src.ui.components.file_uploader import create_file_uploader
-    from src.ui.components.performance_monitor import create_performance_monitor
-    
+    # Phase 4.1 components are imported on first use (see _lazy); a page
+    # whose component fails to import falls back to its basic view
     PHASE_4_1_COMPONENTS_AVAILABLE = True
 except ImportError as e:
     # Fallback for development - show detailed error in app
@@ -46,23 +45,241 @@ except ImportError as e:
         st.code(error_details)
     PHASE_4_1_COMPONENTS_AVAILABLE = False
 
+# Phase 4.1: integrated component factories, as (module, attribute)
+_LAZY = {
+    "review_panel": ("src.ui.components.review_panel", "create_review_panel"),
+    "progress_display": ("src.ui.components.progress_display", "create_progress_display"),
+    "shared_review_engine": ("src.ui.components.progress_display", "get_shared_review_engine"),
+    "results_panel": ("src.ui.components.results_panel", "get_results_panel"),
+    "config_panel": ("src.ui.components.config_panel", "create_config_panel"),
+    "file_uploader": ("src.ui.components.file_uploader", "create_file_uploader"),
+    "performance_monitor": ("src.ui.components.performance_monitor", "create_performance_monitor")
+}
+
+# Latest import failure per component; rendered by the page, never from cached code
+_LAZY_ERRORS: Dict[str, ImportError] = {}
+
+
+def _lazy(name: str):
+    """
+    Import and return a Phase 4.1 factory on first use
+    
+    Failures are recorded in _LAZY_ERRORS for MainInterface to display;
+    nothing is rendered here, since this runs inside cached functions.
+    
+    Args:
+        name: Key in _LAZY
+        
+    Returns:
+        The factory callable
+        
+    Raises:
+        ImportError: If the component module cannot be imported
+    """
+    module_name, attr = _LAZY[name]
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        _LAZY_ERRORS[name] = e
+        raise
+    _LAZY_ERRORS.pop(name, None)
+    return getattr(module, attr)
+
 
 # Phase 4.1 Day 3: Performance optimization decorators
 @st.cache_resource
 def get_cached_component(component_type: str):
     """Cache component instances for better performance"""
-    if component_type == "review_panel":
-        return create_review_panel()
-    elif component_type == "progress_display":
-        return create_progress_display()
-    elif component_type == "results_panel":
-        return create_results_panel()
-    elif component_type == "config_panel":
-        return create_config_panel()
-    elif component_type == "file_uploader":
-        return create_file_uploader()
-    else:
+    if component_type not in _LAZY:
         raise ValueError(f"Unknown component type: {component_type}")
+    return _lazy(component_type)()
+
+
+# Partial reruns (Streamlit >= 1.37); older versions render pages normally
+_fragment = getattr(st, 'fragment', None)
+
+# Upload queue status icons
+STATUS_ICONS = {"queued": "🟡", "processing": "🔵", "completed": "🟢", "error": "🔴"}
+# Prerendered "icon Label" strings for the known statuses
+_STATUS_LABELS = {status: f"{icon} {status.title()}" for status, icon in STATUS_ICONS.items()}
+
+# System status icons, indexed by health flag (False, True)
+_HEALTH_ICONS = ("❌", "✅")
+
+
+# Static page copy, built once at import
+_ABOUT_MD = """
+### 🎯 Mission
+The Automated Review Engine (ARE) streamlines regulatory document review processes 
+for medical device companies, focusing on EU Declaration of Conformity compliance.
+
+### 🚀 Features
+- **Automated Document Processing**: PDF and Word document analysis
+- **Template Validation**: Structure compliance checking
+- **Review Script Execution**: Customizable review workflows
+- **PLM Integration**: Search direction generation
+- **Comprehensive Reporting**: Detailed compliance reports
+
+### 📊 Current Status
+- **Version**: v0.3.1 (Phase 3.1 - UI Foundation)
+- **Development Phase**: User Interface Implementation
+- **Overall Progress**: 40% complete
+
+### 🏗️ Architecture
+Built on modern Python technologies:
+- **Frontend**: Streamlit web framework
+- **Backend**: Python with modular architecture
+- **Configuration**: YAML-based configuration management
+- **Logging**: Comprehensive logging and monitoring
+- **Testing**: Full test coverage with pytest
+"""
+
+_DEV_STATUS_MD = """
+### ✅ Completed Features
+- Main interface framework
+- Navigation system  
+- Page routing
+- Session state management
+- Core component integration
+- File upload interface
+- Settings management
+- System status monitoring
+
+### 🔄 In Development
+- Advanced file processing
+- Review workflow integration
+- Real-time status updates
+- Enhanced error handling
+
+### 📋 Upcoming (Phase 3.2)
+- Document review logic
+- Template validation
+- Review script execution
+- Progress tracking
+"""
+
+
+def _mark_activity():
+    """Record a user interaction (called from widget callbacks only)"""
+    st.session_state.last_activity = datetime.now()
+
+
+def _go_to(page: str, review_status: Optional[Any] = None):
+    """Button callback: switch page before the rerun the click already triggers"""
+    st.session_state.current_page = page
+    _mark_activity()
+    if review_status is not None:
+        st.session_state.current_review_status = review_status
+
+
+def _configure_page():
+    """
+    Apply Streamlit page settings once per session
+    
+    The guard lives in session state because MainInterface is re-created
+    on every rerun, so an instance flag never survives between runs.
+    """
+    if "_page_configured" in st.session_state:
+        return
+    st.session_state._page_configured = True
+    st.set_page_config(
+        page_title="Automated Review Engine",
+        page_icon="📋",
+        layout="wide",
+        initial_sidebar_state="expanded",
+        menu_items={
+            'Get Help': 'https://github.com/your-repo/automated-review-engine',
+            'Report a bug': 'https://github.com/your-repo/automated-review-engine/issues',
+            'About': 'Automated Review Engine v0.3.1 - Regulatory Document Review System'
+        }
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _get_core_components():
+    """
+    Build the core infrastructure components once per process
+    
+    Returns:
+        Tuple of (ConfigManager, LoggingManager, logger, ErrorHandler, DataValidator)
+    """
+    # Initialize configuration
+    config_manager = ConfigManager()
+    config = config_manager.load_config()
+    
+    # Initialize logging
+    logging_config = {
+        'level': 'INFO',
+        'file_enabled': config.logging.file_enabled,
+        'console_enabled': config.logging.console_enabled,
+        'file_path': config.logging.file_path
+    }
+    
+    logger_manager = LoggingManager(logging_config)
+    logger_manager.initialize()
+    logger = logger_manager.get_logger('ui.main_interface')
+    
+    logger.info("Main interface initialized successfully")
+    
+    return config_manager, logger_manager, logger, ErrorHandler(), DataValidator()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pd_np():
+    """Import pandas and numpy on first use and return (pd, np)"""
+    import pandas as pd
+    import numpy as np
+    return pd, np
+
+
+def _warm_heavy():
+    """Import pandas/numpy off the script thread so the first report is not stalled"""
+    try:
+        _get_pd_np()
+    except ImportError:
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _start_warmup() -> threading.Thread:
+    """Start the background warm-up once per process"""
+    thread = threading.Thread(target=_warm_heavy, name="are-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+@st.cache_data(show_spinner=False)
+def _demo_chart_data(seed: int = 0):
+    """Build the sample report chart data once (seeded, so it is stable across reruns)"""
+    pd, np = _get_pd_np()
+    
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        rng.standard_normal((20, 3)),
+        columns=['Compliance', 'Quality', 'Completeness']
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_duration(minutes: int) -> str:
+    """Format a whole-minute session duration (one string per minute bucket)"""
+    return f"{minutes}m"
+
+
+@functools.lru_cache(maxsize=256)
+def _stats_block(n_files: int, n_reviews: int, sid: str) -> str:
+    """Format the sidebar quick-stats lines as one text block"""
+    return "\n".join([
+        f"Files Uploaded: {n_files}",
+        f"Reviews Completed: {n_reviews}",
+        f"Session ID: {sid}",
+        "App Version: v0.3.1"
+    ])
+
+
+# Component timings kept per session, as (function name, seconds)
+_PERF_METRICS_MAXLEN = 64
+
 
 def performance_monitor(func):
     """Decorator to monitor component performance"""
@@ -77,10 +294,11 @@ def performance_monitor(func):
             if hasattr(args[0], 'logger') and args[0].logger:
                 args[0].logger.debug(f"{func.__name__} executed in {execution_time:.3f}s")
             
-            # Store performance metrics in session state
-            if 'performance_metrics' not in st.session_state:
-                st.session_state.performance_metrics = {}
-            st.session_state.performance_metrics[func.__name__] = execution_time
+            # Store performance metrics in session state (bounded ring buffer)
+            metrics = st.session_state.get('performance_metrics')
+            if not isinstance(metrics, deque):
+                metrics = st.session_state['performance_metrics'] = deque(maxlen=_PERF_METRICS_MAXLEN)
+            metrics.append((func.__name__, execution_time))
             
             return result
         except Exception as e:
@@ -94,13 +312,47 @@ def performance_monitor(func):
 class MainInterface:
     """Main interface controller for the Streamlit application"""
     
+    # Sidebar navigation (label, page key), in display order
+    PAGES = (
+        ("🏠 Home", "home"),
+        ("📤 Upload Documents", "upload"),
+        ("📋 Review Dashboard", "review"),
+        ("⚙️ Configuration", "configuration"),
+        ("📊 Results & Analysis", "results"),
+        ("📈 Progress Monitor", "progress"),
+        ("📚 History", "history"),
+        ("🔧 Settings", "settings"),
+        ("ℹ️ About", "about")
+    )
+    _PAGE_KEYS = dict(PAGES)
+    _PAGE_LABELS = {key: label for label, key in PAGES}
+    _NAV_OPTIONS = tuple(label for label, _ in PAGES)
+    
+    # Phase 4.1 components resolved lazily by __getattr__
+    _LAZY_COMPONENTS = frozenset({
+        "review_panel", "progress_display", "results_panel", "config_panel", "file_uploader"
+    })
+    
     def __init__(self):
         """Initialize the main interface with performance optimizations"""
         self.config = None
         self.logger = None
         self.error_handler = None
         self.validator = None
-        self.page_config_set = False
+        
+        # Page key -> render method
+        self._routes = {
+            "home": self._render_home_page,
+            "upload": self._render_upload_page,
+            "review": self._render_review_page,
+            "configuration": self._render_configuration_page,
+            "results": self._render_results_page,
+            "progress": self._render_progress_page,
+            "history": self._render_history_page,
+            "reports": self._render_reports_page,
+            "settings": self._render_settings_page,
+            "about": self._render_about_page
+        }
         
         # Phase 4.1 Day 3: Component cache
         self._component_cache = {}
@@ -126,39 +378,21 @@ class MainInterface:
             'user_settings': {},
             'app_initialized': False,
             'last_activity': datetime.now(),
-            'session_id': f"session_{int(time.time())}"
+            'session_start_time': datetime.now(),
+            'session_id': f"session_{int(time.time())}",
+            'performance_metrics': deque(maxlen=_PERF_METRICS_MAXLEN)
         }
         
-        for key, value in default_state.items():
-            if key not in st.session_state:
-                st.session_state[key] = value
+        missing = {key: value for key, value in default_state.items() if key not in st.session_state}
+        if missing:
+            st.session_state.update(missing)
     
     def _initialize_core_components(self):
         """Initialize core infrastructure components"""
         try:
-            # Initialize configuration
-            self.config = ConfigManager()
-            config = self.config.load_config()
-            
-            # Initialize logging
-            logging_config = {
-                'level': 'INFO',
-                'file_enabled': config.logging.file_enabled,
-                'console_enabled': config.logging.console_enabled,
-                'file_path': config.logging.file_path
-            }
-            
-            self.logger_manager = LoggingManager(logging_config)
-            self.logger_manager.initialize()
-            self.logger = self.logger_manager.get_logger('ui.main_interface')
-            
-            # Initialize error handler
-            self.error_handler = ErrorHandler()
-            
-            # Initialize validator
-            self.validator = DataValidator()
-            
-            self.logger.info("Main interface initialized successfully")
+            # Shared across reruns and sessions (built once per process)
+            (self.config, self.logger_manager, self.logger,
+             self.error_handler, self.validator) = _get_core_components()
             st.session_state.app_initialized = True
             
         except Exception as e:
@@ -169,15 +403,8 @@ class MainInterface:
     def _initialize_phase_4_1_components(self):
         """Initialize Phase 4.1 integrated components with lazy loading"""
         try:
-            # Lazy initialization - only create when needed
+            # Lazy initialization - components are built on first access (__getattr__)
             if not hasattr(self, '_phase_4_1_initialized'):
-                # Use cached components for better performance
-                self.review_panel = get_cached_component("review_panel")
-                self.progress_display = get_cached_component("progress_display") 
-                self.results_panel = get_cached_component("results_panel")
-                self.config_panel = get_cached_component("config_panel")
-                self.file_uploader = get_cached_component("file_uploader")
-                
                 # Initialize Phase 4.1 session state
                 phase_4_1_state = {
                     'current_review_status': None,
@@ -185,14 +412,12 @@ class MainInterface:
                     'uploaded_document': None,
                     'results_history': [],
                     'show_advanced_config': False,
-                    'active_review_id': None,
-                    'performance_metrics': {},
                     'cache_status': 'active'
                 }
                 
-                for key, value in phase_4_1_state.items():
-                    if key not in st.session_state:
-                        st.session_state[key] = value
+                missing = {key: value for key, value in phase_4_1_state.items() if key not in st.session_state}
+                if missing:
+                    st.session_state.update(missing)
                 
                 self._phase_4_1_initialized = True
                 
@@ -211,22 +436,6 @@ class MainInterface:
             self.logger.error(f"Failed to initialize Phase 4.1 components: {e}")
             st.error(f"Phase 4.1 integration error: {e}")
     
-    def configure_page(self):
-        """Configure Streamlit page settings"""
-        if not self.page_config_set:
-            st.set_page_config(
-                page_title="Automated Review Engine",
-                page_icon="📋",
-                layout="wide",
-                initial_sidebar_state="expanded",
-                menu_items={
-                    'Get Help': 'https://github.com/your-repo/automated-review-engine',
-                    'Report a bug': 'https://github.com/your-repo/automated-review-engine/issues',
-                    'About': 'Automated Review Engine v0.3.1 - Regulatory Document Review System'
-                }
-            )
-            self.page_config_set = True
-    
     def render_header(self):
         """Render the main application header"""
         col1, col2, col3 = st.columns([2, 3, 1])
@@ -272,41 +481,30 @@ class MainInterface:
             )
             
         with col4:
-            if st.button("🔄 Refresh", key="refresh_app"):
-                st.rerun()
+            st.button("🔄 Refresh", key="refresh_app", on_click=_mark_activity)
     
     def _get_session_duration(self) -> str:
         """Get formatted session duration"""
-        if 'last_activity' in st.session_state:
-            duration = datetime.now() - st.session_state.last_activity
-            minutes = int(duration.total_seconds() / 60)
-            return f"{minutes}m"
-        return "0m"
+        start = st.session_state.get('session_start_time')
+        if start is None:
+            return _fmt_duration(0)
+        return _fmt_duration(int((time.time() - start.timestamp()) // 60))
     
     def render_sidebar(self):
         """Render the main sidebar navigation"""
         with st.sidebar:
             st.markdown("## 🎯 Navigation")
             
-            # Navigation menu - Phase 4.1 Enhanced
-            pages = {
-                "🏠 Home": "home",
-                "📤 Upload Documents": "upload", 
-                "📋 Review Dashboard": "review",
-                "⚙️ Configuration": "configuration",
-                "📊 Results & Analysis": "results",
-                "📈 Progress Monitor": "progress",
-                "📚 History": "history",
-                "🔧 Settings": "settings",
-                "ℹ️ About": "about"
-            }
-            
-            # Page selection
-            for page_label, page_key in pages.items():
-                if st.button(page_label, key=f"nav_{page_key}", use_container_width=True):
-                    st.session_state.current_page = page_key
-                    st.session_state.last_activity = datetime.now()
-                    st.rerun()
+            # Navigation menu - Phase 4.1 Enhanced (one radio widget)
+            # Sync the radio with page changes made elsewhere, e.g. dashboard buttons
+            st.session_state.nav_radio = self._PAGE_LABELS.get(st.session_state.current_page, self.PAGES[0][0])
+            st.radio(
+                "Navigation",
+                self._NAV_OPTIONS,
+                key="nav_radio",
+                label_visibility="collapsed",
+                on_change=self._on_nav_change
+            )
             
             st.markdown("---")
             
@@ -323,24 +521,49 @@ class MainInterface:
             # System status
             self._render_system_status()
     
+    @staticmethod
+    def _on_nav_change():
+        """Radio callback: switch to the selected page before the rerun"""
+        st.session_state.current_page = MainInterface._PAGE_KEYS[st.session_state.nav_radio]
+        _mark_activity()
+    
+    def __getattr__(self, name: str):
+        """Build a Phase 4.1 component the first time a page touches it"""
+        if name in self._LAZY_COMPONENTS and PHASE_4_1_COMPONENTS_AVAILABLE:
+            try:
+                component = get_cached_component(name)
+            except Exception as e:
+                # hasattr() is False, so the page falls back to its basic view
+                raise AttributeError(name) from e
+            setattr(self, name, component)
+            return component
+        raise AttributeError(name)
+    
+    def _render_component_errors(self):
+        """Show Phase 4.1 component import failures recorded by _lazy"""
+        errors = list(_LAZY_ERRORS.items())
+        if not errors:
+            return
+        
+        st.error("🔧 Development Mode: Some components unavailable")
+        with st.expander("View Error Details"):
+            for name, error in errors:
+                st.code(f"{name}: Component import failed: {error}")
+    
     def _render_sidebar_stats(self):
         """Render quick statistics in sidebar"""
         st.markdown("### 📈 Quick Stats")
         
-        stats = {
-            "Files Uploaded": len(st.session_state.uploaded_files),
-            "Reviews Completed": len(st.session_state.review_results),
-            "Session ID": st.session_state.session_id[-6:],
-            "App Version": "v0.3.1"
-        }
-        
-        for label, value in stats.items():
-            st.text(f"{label}: {value}")
+        st.text(_stats_block(
+            len(st.session_state.uploaded_files),
+            len(st.session_state.review_results),
+            st.session_state.session_id[-6:]
+        ))
     
     def _render_sidebar_performance(self):
         """Render performance monitoring in sidebar - Phase 4.1 Day 3"""
         try:
-            performance_monitor = create_performance_monitor()
+            performance_monitor = get_cached_component("performance_monitor")
             performance_monitor.render_performance_dashboard(show_details=False)
         except Exception as e:
             # Fallback performance display
@@ -374,37 +597,47 @@ class MainInterface:
         ]
         
         for component, status in status_items:
-            icon = "✅" if status else "❌"
-            st.text(f"{icon} {component}")
+            st.text(f"{_HEALTH_ICONS[status]} {component}")
     
     def render_main_content(self):
         """Render main content area based on current page"""
         current_page = st.session_state.current_page
         
         # Page routing - Phase 4.1 Enhanced
-        if current_page == "home":
-            self._render_home_page()
-        elif current_page == "upload":
-            self._render_upload_page()
-        elif current_page == "review":
-            self._render_review_page()
-        elif current_page == "configuration":
-            self._render_configuration_page()
-        elif current_page == "results":
-            self._render_results_page()
-        elif current_page == "progress":
-            self._render_progress_page()
-        elif current_page == "history":
-            self._render_history_page()
-        elif current_page == "settings":
-            self._render_settings_page()
-        elif current_page == "about":
-            self._render_about_page()
-        else:
-            self._render_home_page()
+        self._routes.get(current_page, self._render_home_page)()
     
     def _render_home_page(self):
         """Render the home/dashboard page"""
+        # Warm pandas/numpy in the background while the user reads the dashboard
+        _start_warmup()
+        
+        self._render_home_overview()
+        
+        # Navigation buttons stay outside the fragment so page changes rerun the app
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.button("Go to Upload", key="goto_upload", on_click=_go_to, args=("upload",))
+        
+        with col2:
+            st.button("View Reviews", key="goto_review", on_click=_go_to, args=("review",))
+        
+        with col3:
+            st.button("Generate Reports", key="goto_reports", on_click=_go_to, args=("reports",))
+        
+        # Recent activity
+        st.markdown("## 📈 Recent Activity")
+        
+        if st.session_state.uploaded_files:
+            st.info(f"📄 {len(st.session_state.uploaded_files)} documents uploaded")
+        else:
+            st.info("📝 No recent activity. Upload documents to get started.")
+        
+        # Phase 3.1 development status
+        self._render_development_status()
+    
+    def _render_home_overview(self):
+        """Render the static dashboard welcome and feature overview"""
         st.markdown("## 🏠 Dashboard")
         
         # Welcome message
@@ -420,36 +653,19 @@ class MainInterface:
             with st.container(border=True):
                 st.markdown("### 📤 Document Upload")
                 st.markdown("Upload PDF and Word documents for automated review.")
-                if st.button("Go to Upload", key="goto_upload"):
-                    st.session_state.current_page = "upload"
-                    st.rerun()
         
         with col2:
             with st.container(border=True):
                 st.markdown("### 📋 Review Process")
                 st.markdown("Automated validation against regulatory templates.")
-                if st.button("View Reviews", key="goto_review"):
-                    st.session_state.current_page = "review"
-                    st.rerun()
         
         with col3:
             with st.container(border=True):
                 st.markdown("### 📊 Reports")
                 st.markdown("Generate comprehensive compliance reports.")
-                if st.button("Generate Reports", key="goto_reports"):
-                    st.session_state.current_page = "reports"
-                    st.rerun()
-        
-        # Recent activity
-        st.markdown("## 📈 Recent Activity")
-        
-        if st.session_state.uploaded_files:
-            st.info(f"📄 {len(st.session_state.uploaded_files)} documents uploaded")
-        else:
-            st.info("📝 No recent activity. Upload documents to get started.")
-        
-        # Phase 3.1 development status
-        self._render_development_status()
+    
+    if _fragment:
+        _render_home_overview = _fragment(_render_home_overview)
     
     def _render_upload_page(self):
         """Render the document upload page - Phase 4.1 Enhanced"""
@@ -476,19 +692,13 @@ class MainInterface:
                 col1, col2, col3 = st.columns(3)
                 
                 with col1:
-                    if st.button("🔧 Configure Review", key="configure_from_upload"):
-                        st.session_state.current_page = "configuration"
-                        st.rerun()
+                    st.button("🔧 Configure Review", key="configure_from_upload", on_click=_go_to, args=("configuration",))
                 
                 with col2:
-                    if st.button("▶️ Start Review", key="start_from_upload"):
-                        st.session_state.current_page = "review"
-                        st.rerun()
+                    st.button("▶️ Start Review", key="start_from_upload", on_click=_go_to, args=("review",))
                 
                 with col3:
-                    if st.button("📊 View Progress", key="progress_from_upload"):
-                        st.session_state.current_page = "progress"
-                        st.rerun()
+                    st.button("📊 View Progress", key="progress_from_upload", on_click=_go_to, args=("progress",))
             
         else:
             # Fallback to original upload interface
@@ -500,13 +710,7 @@ class MainInterface:
         
         if PHASE_4_1_COMPONENTS_AVAILABLE and hasattr(self, 'review_panel'):
             # Use Phase 4.1 integrated review panel
-            review_status = st.session_state.get('current_review_status')
-            
-            # Render the enhanced review panel
-            self.review_panel.render_review_interface(
-                review_status=review_status,
-                show_configuration=True
-            )
+            self.review_panel.render_review_interface()
             
         else:
             # Fallback to legacy interface
@@ -516,64 +720,41 @@ class MainInterface:
         if st.session_state.uploaded_files:
             st.markdown("### 📋 Upload Queue")
             
-            for idx, file_info in enumerate(st.session_state.uploaded_files):
-                col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
-                
-                with col1:
-                    st.text(file_info['name'])
-                
-                with col2:
-                    st.text(f"{file_info['size']:,} bytes")
-                
-                with col3:
-                    status_color = {"queued": "🟡", "processing": "🔵", "completed": "🟢", "error": "🔴"}
-                    st.text(f"{status_color.get(file_info['status'], '⚪')} {file_info['status'].title()}")
-                
-                with col4:
-                    if st.button("🗑️", key=f"remove_{idx}", help="Remove file"):
-                        st.session_state.uploaded_files.pop(idx)
-                        st.rerun()
+            self._render_upload_queue_table()
     
-    def _render_review_page(self):
-        """Render the review dashboard page"""
-        st.markdown("## 📋 Review Dashboard")
+    def _render_upload_queue_table(self):
+        """Render the upload queue as one editable table with a remove column"""
+        pd, _ = _get_pd_np()
         
-        if not st.session_state.uploaded_files:
-            st.info("📝 No documents uploaded yet. Visit the Upload page to get started.")
-            return
-        
-        st.markdown(f"### 📊 {len(st.session_state.uploaded_files)} Documents in Queue")
+        files = st.session_state.uploaded_files
+        statuses = [file_info.get('status', 'queued') for file_info in files]
         
-        # Review controls
-        col1, col2, col3 = st.columns(3)
+        queue_df = pd.DataFrame({
+            'Remove': [False] * len(files),
+            'Name': [file_info['name'] for file_info in files],
+            'Size (bytes)': [file_info['size'] for file_info in files],
+            'Status': [_STATUS_LABELS.get(status) or f"⚪ {status.title()}" for status in statuses]
+        })
         
-        with col1:
-            if st.button("🚀 Start All Reviews", key="start_all_reviews"):
-                st.success("🔄 Review process started! (Demo mode)")
-                
-        with col2:
-            if st.button("⏸️ Pause Reviews", key="pause_reviews"):
-                st.info("⏸️ Reviews paused")
-                
-        with col3:
-            if st.button("🔄 Refresh Status", key="refresh_reviews"):
-                st.rerun()
+        edited = st.data_editor(
+            queue_df,
+            hide_index=True,
+            use_container_width=True,
+            disabled=['Name', 'Size (bytes)', 'Status'],
+            column_config={
+                'Remove': st.column_config.CheckboxColumn("🗑️", help="Remove file"),
+                'Size (bytes)': st.column_config.NumberColumn(format="%d")
+            },
+            # Keyed on the queue contents: edits are stored by row position, so a
+            # changed queue must start from a clean editor state
+            key=f"upload_queue_editor_{hash(tuple((f['name'], f['size']) for f in files)):x}"
+        )
         
-        # Document list with status
-        for idx, file_info in enumerate(st.session_state.uploaded_files):
-            with st.expander(f"📄 {file_info['name']}", expanded=False):
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown(f"**Size:** {file_info['size']:,} bytes")
-                    st.markdown(f"**Type:** {file_info['type']}")
-                    st.markdown(f"**Uploaded:** {file_info['upload_time'].strftime('%Y-%m-%d %H:%M')}")
-                
-                with col2:
-                    st.markdown(f"**Status:** {file_info['status'].title()}")
-                    
-                    if st.button(f"📋 Review Details", key=f"review_details_{idx}"):
-                        st.info("📋 Detailed review interface will be implemented in Phase 3.2")
+        if edited['Remove'].any() and st.button("🗑️ Remove selected", key="remove_selected_uploads"):
+            st.session_state.uploaded_files = [
+                file_info for file_info, remove in zip(files, edited['Remove']) if not remove
+            ]
+            st.rerun()
     
     def _render_reports_page(self):
         """Render the reports page"""
@@ -593,7 +774,6 @@ class MainInterface:
         # Generate report button
         if st.button("📈 Generate Report", key="generate_report"):
             with st.spinner("Generating report..."):
-                time.sleep(2)  # Simulate processing
                 st.success(f"✅ {report_type} generated successfully!")
                 
                 # Sample report data
@@ -608,14 +788,7 @@ class MainInterface:
                     st.metric("Review Time", "2.5 min", delta="-0.5 min")
                 
                 # Sample chart
-                import pandas as pd
-                import numpy as np
-                
-                chart_data = pd.DataFrame(
-                    np.random.randn(20, 3),
-                    columns=['Compliance', 'Quality', 'Completeness']
-                )
-                st.line_chart(chart_data)
+                st.line_chart(_demo_chart_data())
     
     def _render_settings_page(self):
         """Render the settings page with performance monitoring"""
@@ -624,14 +797,14 @@ class MainInterface:
         # Settings tabs - Phase 4.1 Day 3 Enhanced
         tab1, tab2, tab3, tab4, tab5 = st.tabs(["🔧 General", "📄 Document", "🔒 Security", "📊 Performance", "🛠️ Advanced"])
         
-        with tab1:
+        with tab1, st.form("general_settings_form", border=False):
             st.markdown("### General Settings")
             
             theme = st.selectbox("Theme", ["Light", "Dark", "Auto"], key="theme_setting")
             language = st.selectbox("Language", ["English", "German", "French"], key="language_setting")
             auto_save = st.checkbox("Auto-save progress", value=True, key="auto_save_setting")
             
-            if st.button("💾 Save General Settings", key="save_general"):
+            if st.form_submit_button("💾 Save General Settings"):
                 st.session_state.user_settings.update({
                     'theme': theme,
                     'language': language,
@@ -639,24 +812,24 @@ class MainInterface:
                 })
                 st.success("✅ Settings saved successfully!")
         
-        with tab2:
+        with tab2, st.form("document_settings_form", border=False):
             st.markdown("### Document Processing Settings")
             
             max_file_size = st.number_input("Max file size (MB)", min_value=1, max_value=100, value=50, key="max_file_size_setting")
             allowed_formats = st.multiselect("Allowed formats", ["PDF", "DOCX", "DOC"], default=["PDF", "DOCX"], key="allowed_formats_setting")
             auto_review = st.checkbox("Enable auto-review", value=True, key="auto_review_setting")
             
-            if st.button("💾 Save Document Settings", key="save_document"):
+            if st.form_submit_button("💾 Save Document Settings"):
                 st.success("✅ Document settings saved!")
         
-        with tab3:
+        with tab3, st.form("security_settings_form", border=False):
             st.markdown("### Security Settings")
             
             enable_encryption = st.checkbox("Enable file encryption", value=True, key="encryption_setting")
             virus_scan = st.checkbox("Enable virus scanning", value=True, key="virus_scan_setting")
             audit_log = st.checkbox("Enable audit logging", value=True, key="audit_log_setting")
             
-            if st.button("💾 Save Security Settings", key="save_security"):
+            if st.form_submit_button("💾 Save Security Settings"):
                 st.success("✅ Security settings saved!")
         
         with tab4:
@@ -664,13 +837,13 @@ class MainInterface:
             
             # Phase 4.1 Day 3: Performance monitoring dashboard
             try:
-                performance_monitor = create_performance_monitor()
+                performance_monitor = get_cached_component("performance_monitor")
                 performance_monitor.render_performance_dashboard(show_details=True)
             except Exception as e:
                 st.error(f"Failed to load performance monitor: {e}")
                 st.info("Performance monitoring features will be available after full initialization")
         
-        with tab5:
+        with tab5, st.form("advanced_settings_form", border=False):
             st.markdown("### Advanced Settings")
             
             debug_mode = st.checkbox("Enable debug mode", value=False, key="debug_mode_setting")
@@ -683,7 +856,7 @@ class MainInterface:
             lazy_loading = st.checkbox("Enable lazy loading", value=True, key="lazy_loading_setting")
             performance_monitoring = st.checkbox("Enable performance monitoring", value=True, key="perf_monitoring_setting")
             
-            if st.button("💾 Save Advanced Settings", key="save_advanced"):
+            if st.form_submit_button("💾 Save Advanced Settings"):
                 st.session_state.user_settings.update({
                     'debug_mode': debug_mode,
                     'api_timeout': api_timeout,
@@ -707,31 +880,7 @@ class MainInterface:
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            st.markdown("""
-            ### 🎯 Mission
-            The Automated Review Engine (ARE) streamlines regulatory document review processes 
-            for medical device companies, focusing on EU Declaration of Conformity compliance.
-            
-            ### 🚀 Features
-            - **Automated Document Processing**: PDF and Word document analysis
-            - **Template Validation**: Structure compliance checking
-            - **Review Script Execution**: Customizable review workflows
-            - **PLM Integration**: Search direction generation
-            - **Comprehensive Reporting**: Detailed compliance reports
-            
-            ### 📊 Current Status
-            - **Version**: v0.3.1 (Phase 3.1 - UI Foundation)
-            - **Development Phase**: User Interface Implementation
-            - **Overall Progress**: 40% complete
-            
-            ### 🏗️ Architecture
-            Built on modern Python technologies:
-            - **Frontend**: Streamlit web framework
-            - **Backend**: Python with modular architecture
-            - **Configuration**: YAML-based configuration management
-            - **Logging**: Comprehensive logging and monitoring
-            - **Testing**: Full test coverage with pytest
-            """)
+            st.markdown(_ABOUT_MD)
         
         with col2:
             st.markdown("### 📈 Development Timeline")
@@ -768,34 +917,15 @@ class MainInterface:
             st.text(f"Python Version: {sys.version.split()[0]}")
             st.text(f"Streamlit Version: {st.__version__}")
     
+    if _fragment:
+        _render_about_page = _fragment(_render_about_page)
+    
     def _render_development_status(self):
         """Render development status information"""
         st.markdown("---")
         
         with st.expander("🚧 Phase 3.1 Development Status", expanded=False):
-            st.markdown("""
-            ### ✅ Completed Features
-            - Main interface framework
-            - Navigation system  
-            - Page routing
-            - Session state management
-            - Core component integration
-            - File upload interface
-            - Settings management
-            - System status monitoring
-            
-            ### 🔄 In Development
-            - Advanced file processing
-            - Review workflow integration
-            - Real-time status updates
-            - Enhanced error handling
-            
-            ### 📋 Upcoming (Phase 3.2)
-            - Document review logic
-            - Template validation
-            - Review script execution
-            - Progress tracking
-            """)
+            st.markdown(_DEV_STATUS_MD)
     
     def render_footer(self):
         """Render application footer"""
@@ -819,8 +949,8 @@ class MainInterface:
             # Phase 4.1 Day 3: Performance optimization
             start_time = time.time()
             
-            # Configure page (cached)
-            self.configure_page()
+            # Configure page (once per session)
+            _configure_page()
             
             # Periodic cache management
             self._manage_cache_lifecycle()
@@ -834,12 +964,12 @@ class MainInterface:
             # Render main content (optimized)
             self.render_main_content()
             
+            # Component import failures recorded while rendering the page
+            self._render_component_errors()
+            
             # Render footer
             self.render_footer()
             
-            # Update activity timestamp and performance metrics
-            st.session_state.last_activity = datetime.now()
-            
             # Track overall performance
             total_time = time.time() - start_time
             if 'app_performance' not in st.session_state:
@@ -919,9 +1049,7 @@ class MainInterface:
                     st.rerun()
             
             with col3:
-                if st.button("▶️ Start Review", key="start_from_config"):
-                    st.session_state.current_page = "review"
-                    st.rerun()
+                st.button("▶️ Start Review", key="start_from_config", on_click=_go_to, args=("review",))
         else:
             st.warning("⚠️ Phase 4.1 configuration panel not available")
             st.info("Using legacy configuration interface")
@@ -949,9 +1077,7 @@ class MainInterface:
                 4. 📊 View comprehensive results
                 """)
                 
-                if st.button("🚀 Start New Review", key="start_new_from_results"):
-                    st.session_state.current_page = "upload"
-                    st.rerun()
+                st.button("🚀 Start New Review", key="start_new_from_results", on_click=_go_to, args=("upload",))
         else:
             st.warning("⚠️ Phase 4.1 results panel not available")
     
@@ -960,13 +1086,14 @@ class MainInterface:
         st.markdown("## 📈 Progress Monitor")
         
         if PHASE_4_1_COMPONENTS_AVAILABLE and hasattr(self, 'progress_display'):
-            # Use Phase 4.1 integrated progress display
-            review_status = st.session_state.get('current_review_status')
+            # Use Phase 4.1 integrated progress display for the review panel's
+            # current review (submitted to the same shared engine)
+            review_id = st.session_state.get('review_panel_current_review')
             
-            if review_status:
+            if review_id:
                 self.progress_display.render_progress_interface(
-                    review_status=review_status,
-                    auto_refresh=True
+                    review_engine=_lazy("shared_review_engine")(),
+                    review_id=review_id
                 )
             else:
                 st.info("📈 No active review to monitor")
@@ -979,9 +1106,7 @@ class MainInterface:
                 - 📋 Detailed processing logs
                 """)
                 
-                if st.button("📤 Upload Document", key="upload_from_progress"):
-                    st.session_state.current_page = "upload"
-                    st.rerun()
+                st.button("📤 Upload Document", key="upload_from_progress", on_click=_go_to, args=("upload",))
         else:
             st.warning("⚠️ Phase 4.1 progress display not available")
     
@@ -1008,11 +1133,9 @@ class MainInterface:
                         st.write(f"**Status:** {review.get('status', 'Unknown')}")
                         st.write(f"**Issues:** {review.get('critical_issues', 0)}")
                         
-                        if st.button(f"📊 View Details", key=f"view_history_{i}"):
-                            # Load this review as current
-                            st.session_state.current_review_status = review
-                            st.session_state.current_page = "results"
-                            st.rerun()
+                        # Load this review as current
+                        st.button(f"📊 View Details", key=f"view_history_{i}",
+                                  on_click=_go_to, args=("results",), kwargs={'review_status': review})
         else:
             st.info("📚 No review history available yet")
             st.markdown("""
@@ -1024,9 +1147,7 @@ class MainInterface:
             - 🔍 Search and filter capabilities
             """)
             
-            if st.button("🚀 Start First Review", key="start_first_review"):
-                st.session_state.current_page = "upload"
-                st.rerun()
+            st.button("🚀 Start First Review", key="start_first_review", on_click=_go_to, args=("upload",))
         
         # History management
         if history:
@@ -1085,6 +1206,7 @@ class MainInterface:
                             'type': uploaded_file.type,
                             'upload_time': datetime.now()
                         })
+                        st.session_state.last_activity = datetime.now()
                         st.success(f"Added {uploaded_file.name} to review queue")
                         
         except Exception as e:
@@ -1093,27 +1215,32 @@ class MainInterface:
     
     def _render_legacy_review_interface(self):
         """Legacy review interface fallback"""
-        if st.session_state.uploaded_files:
-            st.markdown("### 📋 Review Queue")
-            
-            for i, file_info in enumerate(st.session_state.uploaded_files):
-                with st.expander(f"📄 {file_info['name']}", expanded=False):
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.write(f"**Size:** {file_info['size']:,} bytes")
-                        st.write(f"**Type:** {file_info['type']}")
-                        st.write(f"**Uploaded:** {file_info['upload_time'].strftime('%Y-%m-%d %H:%M:%S')}")
-                    
-                    with col2:
-                        if st.button(f"🔍 Review {file_info['name']}", key=f"review_{i}"):
-                            st.info("🚧 Review functionality will be implemented in Phase 3.2")
-                        
-                        if st.button(f"🗑️ Remove", key=f"remove_{i}"):
-                            st.session_state.uploaded_files.pop(i)
-                            st.rerun()
-        else:
+        if not st.session_state.uploaded_files:
             st.info("📝 No documents in review queue. Upload documents to get started.")
+            return
+        
+        st.markdown(f"### 📊 {len(st.session_state.uploaded_files)} Documents in Queue")
+        
+        # Review controls (one form: a single rerun per submit)
+        with st.form("review_controls", border=False):
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                start_all = st.form_submit_button("🚀 Start All Reviews")
+            
+            with col2:
+                pause = st.form_submit_button("⏸️ Pause Reviews")
+            
+            with col3:
+                # Submitting is the refresh
+                st.form_submit_button("🔄 Refresh Status")
+        
+        if start_all:
+            st.success("🔄 Review process started! (Demo mode)")
+        elif pause:
+            st.info("⏸️ Reviews paused")
+        
+        # The queue itself is listed by the upload queue table below
 
 
 # Factory function for easy instantiation
@@ -0,0 +1,254 @@
+"""
+Tests for UI Components
+
+Test suite for shared UI component behavior including:
+- Review engine sharing between the review panel and progress page
+- Per-session status history and unknown-status fallback
+- Upload temp file lifecycle
+- Progress page tracking of the review panel's current review
+- Rendering of every routed page
+- Settings panel return contract
+"""
+
+import io
+import pytest
+from enum import IntEnum
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+# UI components need Streamlit; skip the module where it is not installed
+st = pytest.importorskip("streamlit")
+
+from streamlit.testing.v1 import AppTest
+
+from src.ui.components import file_uploader, progress_display, review_panel
+from src.ui.components.status_indicator import StatusType, _status_entry
+from src.ui.main_interface import MainInterface
+
+
+def _run_main_app():
+    """App script: run the full main interface"""
+    from src.ui.main_interface import create_main_interface
+    create_main_interface().run()
+
+
+def _render_settings():
+    """App script: render the settings panel and keep what it returned"""
+    import streamlit as st
+    from src.ui.components.settings_panel import create_settings_panel
+    st.session_state["returned_settings"] = create_settings_panel().render_settings_interface()
+
+
+def _render_one_status():
+    """App script: render a single status through the shared indicator"""
+    from src.ui.components.status_indicator import create_status_indicator, StatusType
+    create_status_indicator().render_status(StatusType.SUCCESS, "Saved")
+
+
+class _Upload(io.BytesIO):
+    """In-memory upload with the attributes of Streamlit's UploadedFile"""
+
+    def __init__(self, data: bytes, name: str, mime_type: str = "application/pdf"):
+        super().__init__(data)
+        self.name = name
+        self.size = len(data)
+        self.type = mime_type
+
+
+class TestSharedReviewEngine:
+    """Test suite for the process-wide review engine"""
+
+    @pytest.fixture
+    def engine(self):
+        """Provide a fresh shared engine and shut it down afterwards"""
+        progress_display.get_shared_review_engine.clear()
+        engine = progress_display.get_shared_review_engine()
+        yield engine
+        if engine is not None:
+            engine.shutdown()
+        progress_display.get_shared_review_engine.clear()
+
+    def test_engine_is_cached(self, engine):
+        """Test that repeated calls return the same engine"""
+        assert engine is not None
+        assert progress_display.get_shared_review_engine() is engine
+
+    def test_review_panel_uses_shared_engine(self, engine):
+        """Test that reviews are submitted to the engine the progress page polls"""
+        panel = review_panel.ReviewPanel.__new__(review_panel.ReviewPanel)
+        panel._initialize_review_engine()
+
+        assert panel.review_engine is engine
+
+    def test_progress_page_shows_submitted_review(self, engine, tmp_path):
+        """Test that the progress page tracks the review panel's submitted review"""
+        from src.review import create_review_request
+
+        document = tmp_path / "declaration.pdf"
+        document.write_bytes(b"%PDF-1.4\n")
+        review_id = engine.submit_review(create_review_request(document_path=str(document)))
+
+        at = AppTest.from_function(_run_main_app)
+        at.session_state["current_page"] = "progress"
+        at.session_state["review_panel_current_review"] = review_id
+        at.run(timeout=60)
+
+        assert not at.exception
+        assert not [info for info in at.info if "No active review" in info.value]
+        assert not [error for error in at.error if "Could not find review" in error.value]
+
+    def test_finished_review_wakes_and_drops_callbacks(self, tmp_path):
+        """Test that progress callbacks hear the final status and are then released"""
+        from src.review import ReviewEngine, create_review_request
+
+        engine = ReviewEngine(config={'enable_background_processing': False})
+        document = tmp_path / "declaration.pdf"
+        document.write_bytes(b"%PDF-1.4\n")
+        review_id = engine.submit_review(create_review_request(document_path=str(document)))
+        stages = []
+        engine.register_progress_callback(review_id, lambda _id, progress: stages.append(progress.stage))
+
+        assert engine.cancel_review(review_id)
+        assert stages == ["finalization"]
+        assert review_id not in engine.progress_callbacks
+        engine.shutdown()
+
+    def test_engine_uses_shared_config(self, engine):
+        """Test that the shared engine is built from the shared configuration"""
+        for key, value in progress_display.REVIEW_ENGINE_CONFIG.items():
+            assert engine.config[key] == value
+
+
+class TestPageRouting:
+    """Test suite for rendering each routed page of the main interface"""
+
+    @pytest.mark.parametrize("page", [key for _, key in MainInterface.PAGES] + ["reports"])
+    def test_page_renders(self, page):
+        """Test that each page renders without an exception or application error"""
+        at = AppTest.from_function(_run_main_app)
+        at.session_state["current_page"] = page
+        at.run(timeout=60)
+
+        assert not at.exception
+        assert not [error for error in at.error if "Application Error" in error.value]
+
+
+class TestSettingsPanel:
+    """Test suite for the settings panel return contract"""
+
+    def test_returns_current_values(self):
+        """Test that the current widget values are returned before saving"""
+        at = AppTest.from_function(_render_settings).run()
+
+        assert at.session_state["returned_settings"]["theme"] == "Light"
+        assert not at.session_state["settings_saved"]
+
+    def test_saved_flag_tracks_edits(self):
+        """Test that settings_saved follows saves and later edits"""
+        at = AppTest.from_function(_render_settings).run()
+        at.button[0].click().run()
+        assert at.session_state["settings_saved"]
+
+        at.selectbox[0].set_value("Dark").run()
+        assert at.session_state["returned_settings"]["theme"] == "Dark"
+        assert not at.session_state["settings_saved"]
+
+
+class TestStatusIndicator:
+    """Test suite for the cached StatusIndicator"""
+
+    def test_history_is_per_session(self):
+        """Test that sessions sharing the cached indicator keep separate histories"""
+        first = AppTest.from_function(_render_one_status).run()
+        second = AppTest.from_function(_render_one_status).run()
+
+        assert len(first.session_state["status_indicator_history"]) == 1
+        assert len(second.session_state["status_indicator_history"]) == 1
+
+    @pytest.mark.parametrize("status", [StatusType.SUCCESS, StatusType.PROCESSING])
+    def test_known_status_lookup(self, status):
+        """Test that known statuses map to their own icon and method"""
+        icon, method = _status_entry(status)
+        assert icon == ("✅" if status is StatusType.SUCCESS else "🔄")
+
+    def test_status_type_indexes_table(self):
+        """Test that StatusType values index the status table directly"""
+        assert issubclass(StatusType, IntEnum)
+        assert _status_entry(int(StatusType.ERROR)) == _status_entry(StatusType.ERROR)
+
+    @pytest.mark.parametrize("status", ["success", "unknown", 99, -1, None])
+    def test_unknown_status_falls_back_to_info(self, status):
+        """Test that unknown statuses render as INFO instead of raising"""
+        assert _status_entry(status) == _status_entry(StatusType.INFO)
+
+
+class TestUploadTempFiles:
+    """Test suite for upload temp file ownership"""
+
+    @pytest.fixture
+    def uploader(self):
+        """Provide a FileUploader without session state setup"""
+        uploader = file_uploader.FileUploader.__new__(file_uploader.FileUploader)
+        uploader.config = uploader._get_default_config()
+        uploader.logger = None
+        return uploader
+
+    def _files(self):
+        """List the files currently in the upload directory"""
+        return set(file_uploader._process_upload_dir().iterdir())
+
+    def test_upload_dir_is_shared(self):
+        """Test that the upload directory is created once and reused"""
+        upload_dir = file_uploader._process_upload_dir()
+        assert upload_dir.is_dir()
+        assert file_uploader._process_upload_dir() == upload_dir
+
+    def test_rejected_upload_is_removed(self, uploader):
+        """Test that a file rejected by validation does not stay on disk"""
+        uploader.validator = Mock()
+        uploader.validator.validate_file_upload.return_value = SimpleNamespace(
+            is_valid=False, errors=["Rejected"], warnings=[]
+        )
+        before = self._files()
+
+        result = uploader._process_single_file(_Upload(b"%PDF-rejected", "rejected.pdf"), "test")
+
+        assert not result['success']
+        assert result['errors'] == ["Rejected"]
+        assert self._files() == before
+
+    def test_accepted_upload_is_stored_by_content(self, uploader, monkeypatch):
+        """Test that an accepted file is kept under its content hash and nothing else remains"""
+        import hashlib
+
+        monkeypatch.setattr(file_uploader, "DOCUMENT_ANALYZER_AVAILABLE", False)
+        monkeypatch.setattr(file_uploader.st, "session_state", SimpleNamespace(file_upload_history=[]))
+        uploader.config.update(
+            enable_hash_validation=False, enable_metadata_extraction=False, enable_virus_scan=False
+        )
+        uploader.validator = Mock()
+        uploader.validator.validate_file_upload.return_value = SimpleNamespace(
+            is_valid=True, errors=[], warnings=[]
+        )
+        data = b"%PDF-accepted"
+        before = self._files()
+
+        result = uploader._process_single_file(_Upload(data, "Accepted.PDF"), "test")
+
+        stored = file_uploader._process_upload_dir() / f"{hashlib.blake2b(data, digest_size=16).hexdigest()}.pdf"
+        assert result['success']
+        assert result['path'] == str(stored)
+        assert self._files() - before <= {stored}
+        assert stored.read_bytes() == data
+        stored.unlink()
+
+    def test_failed_upload_is_removed(self, uploader):
+        """Test that a file whose processing raises does not stay on disk"""
+        uploader.validator = Mock()
+        uploader.validator.validate_file_upload.side_effect = RuntimeError("boom")
+        before = self._files()
+
+        result = uploader._process_single_file(_Upload(b"%PDF-failed", "failed.pdf"), "test")
+
+        assert not result['success']
+        assert self._files() == before